@@ -54,7 +54,7 @@ resource "google_project_iam_member" "ingest_bq_writer" {
   member  = "serviceAccount:${google_service_account.ingest_sa.email}"
 }
 
-# The Python service parsing GRIB2 byte-ranges via xarray/kerchunk in memory
+# The Python service parsing GRIB2 byte-ranges with ecCodes in memory
 resource "google_cloud_run_v2_service" "grib_parser" {
   name     = "grib2-byte-parser"
   location = var.region
@@ -64,7 +64,7 @@ resource "google_cloud_run_v2_service" "grib_parser" {
     containers {
       image = "${var.region}-docker.pkg.dev/${var.project_id}/${google_artifact_registry_repository.wx_repo.repository_id}/grib2-parser:latest"
       resources {
-        limits = { cpu = "2", memory = "8Gi" } # High RAM required for xarray array manipulation
+        limits = { cpu = "2", memory = "8Gi" } # High RAM required for decoded GRIB2 grids
       }
       env {
         name  = "BQ_DATASET"
@@ -15,6 +15,19 @@ logger = logging.getLogger(__name__)
 
 _ee_initialized = False
 
+# NLCD class names
+NLCD_CLASSES = {
+    "11": "Open Water", "12": "Perennial Ice/Snow",
+    "21": "Developed, Open Space", "22": "Developed, Low Intensity",
+    "23": "Developed, Medium Intensity", "24": "Developed, High Intensity",
+    "31": "Barren Land", "41": "Deciduous Forest",
+    "42": "Evergreen Forest", "43": "Mixed Forest",
+    "51": "Dwarf Scrub", "52": "Shrub/Scrub",
+    "71": "Grassland/Herbaceous", "72": "Sedge/Herbaceous",
+    "81": "Pasture/Hay", "82": "Cultivated Crops",
+    "90": "Woody Wetlands", "95": "Emergent Herbaceous Wetlands",
+}
+
 
 def _init_ee() -> None:
     """Initialize Earth Engine API."""
@@ -43,26 +56,13 @@ def extract_terrain_for_city(
     slope = ee.Terrain.slope(elevation)
     aspect = ee.Terrain.aspect(elevation)
 
-    # Sample elevation statistics within buffer
-    elev_stats = elevation.reduceRegion(
-        reducer=ee.Reducer.percentile([10, 25, 50, 75, 90]).combine(
-            ee.Reducer.minMax(), sharedInputs=True
-        ),
-        geometry=buffer,
-        scale=30,
-        maxPixels=1e7,
-    ).getInfo()
-
-    # Slope and aspect stats
-    slope_stats = slope.reduceRegion(
-        reducer=ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True),
-        geometry=buffer,
-        scale=30,
-        maxPixels=1e7,
-    ).getInfo()
-
-    aspect_stats = aspect.reduceRegion(
-        reducer=ee.Reducer.mean(),
+    # Elevation, slope and aspect stats in a single reduceRegion round trip.
+    # Output keys are prefixed with the band name, e.g. elevation_p50, slope_mean.
+    terrain_stats = elevation.addBands(slope).addBands(aspect).reduceRegion(
+        reducer=ee.Reducer.percentile([10, 25, 50, 75, 90])
+        .combine(ee.Reducer.minMax(), sharedInputs=True)
+        .combine(ee.Reducer.mean(), sharedInputs=True)
+        .combine(ee.Reducer.stdDev(), sharedInputs=True),
         geometry=buffer,
         scale=30,
         maxPixels=1e7,
@@ -77,27 +77,15 @@ def extract_terrain_for_city(
         maxPixels=1e7,
     ).getInfo()
 
-    # NLCD class names
-    nlcd_classes = {
-        "11": "Open Water", "12": "Perennial Ice/Snow",
-        "21": "Developed, Open Space", "22": "Developed, Low Intensity",
-        "23": "Developed, Medium Intensity", "24": "Developed, High Intensity",
-        "31": "Barren Land", "41": "Deciduous Forest",
-        "42": "Evergreen Forest", "43": "Mixed Forest",
-        "51": "Dwarf Scrub", "52": "Shrub/Scrub",
-        "71": "Grassland/Herbaceous", "72": "Sedge/Herbaceous",
-        "81": "Pasture/Hay", "82": "Cultivated Crops",
-        "90": "Woody Wetlands", "95": "Emergent Herbaceous Wetlands",
-    }
-
-    land_cover = {}
+    # Land cover percentages; class names are only resolved for classes
+    # that clear the 1% cut.
     raw_hist = lc_hist.get("landcover", {})
-    total = sum(raw_hist.values()) if raw_hist else 1
-    for code, count in raw_hist.items():
-        name = nlcd_classes.get(str(code), f"Class {code}")
-        pct = round(count / total * 100, 1)
-        if pct >= 1.0:  # Only include classes >= 1%
-            land_cover[name] = pct
+    total = sum(raw_hist.values()) or 1
+    land_cover = {
+        NLCD_CLASSES.get(str(code), f"Class {code}"): pct
+        for code, count in raw_hist.items()
+        if (pct := round(count / total * 100, 1)) >= 1.0  # Only include classes >= 1%
+    }
 
     # Build elevation bands config
     elev_bands_data = []
@@ -108,9 +96,9 @@ def extract_terrain_for_city(
         })
 
     slope_aspect = {
-        "mean_slope_deg": slope_stats.get("elevation_slope_mean"),
-        "slope_stddev": slope_stats.get("elevation_slope_stdDev"),
-        "mean_aspect_deg": aspect_stats.get("elevation_aspect_mean"),
+        "mean_slope_deg": terrain_stats.get("slope_mean"),
+        "slope_stddev": terrain_stats.get("slope_stdDev"),
+        "mean_aspect_deg": terrain_stats.get("aspect_mean"),
     }
 
     # Write to BigQuery
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any
@@ -36,7 +37,6 @@ MICROZONES: dict[str, list[dict]] = {}
 
 def _load_microzones() -> dict[str, list[dict]]:
     """Load microzone definitions from config file."""
-    import os
     config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config", "microzones.json")
     config_path = os.path.normpath(config_path)
     if not os.path.exists(config_path):
@@ -561,6 +561,5 @@ async def trigger_gee_terrain() -> GeeResponse:
 
 
 if __name__ == "__main__":
-    import os
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", "8080")))
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
+from typing import Final
 
 
 def _k_to_f(k: float | None) -> str | None:
@@ -306,12 +307,30 @@ def _horizon_blend_summary(forecasts: list[dict], now: datetime) -> str:
     return "\n".join(lines)
 
 
+def _spread(values: list[float | None]) -> float | None:
+    """Return max-min over non-null values in one pass, or None with fewer than two."""
+    lo = hi = None
+    count = 0
+    for v in values:
+        if v is None:
+            continue
+        count += 1
+        if lo is None or v < lo:
+            lo = v
+        if hi is None or v > hi:
+            hi = v
+    if count < 2:
+        return None
+    return hi - lo
+
+
 def _model_disagreement_summary(forecasts: list[dict]) -> str:
     """Compute model spread metrics for temperature and precip at overlapping valid times."""
     if not forecasts:
         return "No model disagreement data (insufficient forecasts)."
 
-    by_time: dict[str, dict[str, dict[str, float | None]]] = {}
+    # valid_time -> model -> (temp_k, precip); later rows for a model win, as before.
+    by_time: dict[str, dict[str, tuple[float | None, float | None]]] = {}
     for row in forecasts:
         if row.get("elevation_band") is not None:
             continue
@@ -319,27 +338,21 @@ def _model_disagreement_summary(forecasts: list[dict]) -> str:
         model = str(row.get("model_name", ""))
         if not vt or not model:
             continue
-        if vt not in by_time:
-            by_time[vt] = {}
-        by_time[vt][model] = {
-            "temp_k": row.get("temperature_2m"),
-            "precip": row.get("precip_kg_m2"),
-        }
+        by_time.setdefault(vt, {})[model] = (row.get("temperature_2m"), row.get("precip_kg_m2"))
 
     lines: list[str] = []
-    for vt in sorted(by_time.keys())[:8]:
+    for vt in sorted(by_time)[:8]:
         models = by_time[vt]
         if len(models) < 2:
             continue
-        temps = [v["temp_k"] for v in models.values() if v.get("temp_k") is not None]
-        precips = [v["precip"] for v in models.values() if v.get("precip") is not None]
-        parts = [f"valid={vt}, models={','.join(sorted(models.keys()))}"]
-        if len(temps) >= 2:
-            spread_f = (max(temps) - min(temps)) * 9 / 5
-            parts.append(f"temp_spread={spread_f:.1f}F")
-        if len(precips) >= 2:
-            spread_in = (max(precips) - min(precips)) * 0.0393701
-            parts.append(f"precip_spread={spread_in:.2f}in")
+        values = models.values()
+        parts = [f"valid={vt}, models={','.join(sorted(models))}"]
+        temp_spread = _spread([t for t, _ in values])
+        if temp_spread is not None:
+            parts.append(f"temp_spread={temp_spread * 9 / 5:.1f}F")
+        precip_spread = _spread([p for _, p in values])
+        if precip_spread is not None:
+            parts.append(f"precip_spread={precip_spread * 0.0393701:.2f}in")
         lines.append("  " + ", ".join(parts))
 
     if not lines:
@@ -347,44 +360,13 @@ def _model_disagreement_summary(forecasts: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def build_commentary_prompt(
-    city_slug: str,
-    city_name: str,
-    forecasts: list[dict],
-    drift_data: list[dict],
-    terrain: dict | None,
-    verification_scores: list[dict],
-    *,
-    tone_instruction: str = "",
-    microzones: list[dict] | None = None,
-) -> str:
-    """Build the full prompt for Gemini to generate forecast commentary."""
-    now = datetime.now(timezone.utc)
-
-    microzone_section = ""
-    if microzones:
-        zone_lines = []
-        for z in microzones:
-            zone_lines.append(
-                f"- {z['name']} ({z['zone_id']}): elev {z['elevation_range_m'][0]}-{z['elevation_range_m'][1]}m, "
-                f"{z.get('terrain_notes', '')}"
-            )
-        microzone_section = "## City Microzones\n" + "\n".join(zone_lines)
-
-    tone_block = ""
-    if tone_instruction:
-        tone_block = f"\n## Voice / Tone Instruction\n{tone_instruction}\n"
-
-    return f"""You are a hyperlocal weather forecaster writing for {city_name}. Write in a conversational,
+# Static prompt sections are built once at import; build_commentary_prompt only
+# renders the per-city sections and joins everything in a single pass.
+_PROMPT_PERSONA: Final[str] = """Write in a conversational,
 engaging style similar to durangoweatherguy.com — knowledgeable but approachable, like you're talking to
-a neighbor over the fence. You deeply understand mountain/terrain weather and local microclimates.
-{tone_block}
-Current UTC time: {now.isoformat()}
+a neighbor over the fence. You deeply understand mountain/terrain weather and local microclimates."""
 
-## Your Task
-Generate a comprehensive forecast commentary for {city_name} ({city_slug}). Include:
-
-1. **Current Conditions Summary** — What's happening right now based on the latest model data
+_PROMPT_TASK_CHECKLIST: Final[str] = """1. **Current Conditions Summary** — What's happening right now based on the latest model data
 2. **Today's Forecast** — Temperature highs/lows, wind, precipitation chances
 3. **Model Agreement/Disagreement** — Where models agree and where they diverge. If models are trending
    in a consistent direction (drift), mention that. If one model is an outlier, call it out.
@@ -397,89 +379,48 @@ Generate a comprehensive forecast commentary for {city_name} ({city_slug}). Incl
    - immediate (0-6h)
    - short (6-48h)
    - extended (>48h)
-   Use horizon model priority rules from "Horizon-Aware Blend Guidance".
-
-## Terrain Context
-{_format_terrain(terrain)}
-
-{microzone_section}
-
-## Model Disagreement (spread at overlapping timesteps)
-{_model_disagreement_summary(forecasts)}
-
-## Data Availability Summary (important)
-{_data_availability_summary(forecasts)}
+   Use horizon model priority rules from "Horizon-Aware Blend Guidance"."""
 
-## Horizon-Aware Blend Guidance (explicit model priority rules)
-{_horizon_blend_summary(forecasts, now)}
-
-## Latest Model Forecasts
-{_format_forecasts_by_model(forecasts)}
-
-## Model Drift (Run-to-Run Changes)
-{_format_drift(drift_data)}
-
-## Model Verification Scores (30-day rolling)
-{_format_verification(verification_scores)}
-
-## Output Format
-Respond with a JSON object containing these fields:
-{{
-    "city_slug": "{city_slug}",
-    "city_name": "{city_name}",
-    "generated_at": "<ISO timestamp>",
+_PROMPT_OUTPUT_SCHEMA: Final[str] = """    "generated_at": "<ISO timestamp>",
     "headline": "<catchy 1-line summary, e.g. 'Snow levels dropping tonight — powder day potential above 9,000ft'>",
     "current_conditions": "<2-3 sentence summary>",
     "todays_forecast": "<3-5 sentences, conversational>",
     "model_analysis": "<2-4 sentences about model agreement/disagreement/drift>",
-    "elevation_breakdown": {{
+    "elevation_breakdown": {
         "summary": "<2-3 sentences>",
         "bands": [
-            {{"elevation_m": <int>, "elevation_ft": <int>, "description": "<1-2 sentences>"}}
+            {"elevation_m": <int>, "elevation_ft": <int>, "description": "<1-2 sentences>"}
         ]
-    }},
+    },
     "extended_outlook": "<3-5 sentences covering days 2-7>",
-    "confidence": {{
+    "confidence": {
         "level": "<high|moderate|low>",
         "explanation": "<1-2 sentences>"
-    }},
+    },
     "best_model": "<which model has been most accurate here, based on verification scores>",
-    "horizon_confidence": {{
+    "horizon_confidence": {
         "immediate_0_6h": "<1 sentence rationale for immediate horizon model blend>",
         "short_6_48h": "<1 sentence rationale for short horizon model blend>",
         "extended_48h_plus": "<1 sentence rationale for extended horizon model blend>"
-    }},
-    "dayparts": {{
+    },
+    "dayparts": {
         "am": "<1-3 sentence morning forecast>",
         "pm": "<1-3 sentence afternoon forecast>",
         "night": "<1-3 sentence evening/overnight forecast>"
-    }},
+    },
     "changes": ["<string describing what changed vs prior run, e.g. 'GFS warmed 3F for tomorrow afternoon'>"],
-    "model_disagreement": {{
+    "model_disagreement": {
         "level": "<low|moderate|high>",
         "summary": "<1-2 sentences about model spread>",
         "biggest_spread_metric": "<temp|precip|snow|wind>",
         "biggest_spread_value": "<human-readable spread, e.g. '8F temp spread'>",
         "confidence_trend": "<improving|stable|degrading>"
-    }},
-    "dayparts": {{
-        "am": "<1-3 sentence morning forecast>",
-        "pm": "<1-3 sentence afternoon forecast>",
-        "night": "<1-3 sentence evening/overnight forecast>"
-    }},
-    "changes": ["<string describing what changed vs prior run, e.g. 'GFS warmed 3F for tomorrow afternoon'>"],
-    "model_disagreement": {{
-        "level": "<low|moderate|high>",
-        "summary": "<1-2 sentences about model spread>",
-        "biggest_spread_metric": "<temp|precip|snow|wind>",
-        "biggest_spread_value": "<human-readable spread, e.g. '8F temp spread'>",
-        "confidence_trend": "<improving|stable|degrading>"
-    }},
+    },
     "alerts": ["<any notable weather alerts or warnings>"],
     "updated_at": "<ISO timestamp>"
-}}
+}"""
 
-Write naturally and engagingly. Don't just list numbers — interpret them. Say things like "the HRRR has been
+_PROMPT_GUIDELINES: Final[str] = """Write naturally and engagingly. Don't just list numbers — interpret them. Say things like "the HRRR has been
 flip-flopping on snow totals" or "all models are in rare agreement on a dry weekend." Reference specific
 elevations in feet for US audiences. Mention local terrain features when relevant.
 
@@ -490,3 +431,76 @@ Critical guardrails:
   forecast from those fields.
 - Avoid repeating "N/A" in prose.
 """
+
+
+def build_commentary_prompt(
+    city_slug: str,
+    city_name: str,
+    forecasts: list[dict],
+    drift_data: list[dict],
+    terrain: dict | None,
+    verification_scores: list[dict],
+    *,
+    tone_instruction: str = "",
+    microzones: list[dict] | None = None,
+) -> str:
+    """Build the full prompt for Gemini to generate forecast commentary."""
+    now = datetime.now(timezone.utc)
+
+    microzone_section = ""
+    if microzones:
+        zone_lines = []
+        for z in microzones:
+            zone_lines.append(
+                f"- {z['name']} ({z['zone_id']}): elev {z['elevation_range_m'][0]}-{z['elevation_range_m'][1]}m, "
+                f"{z.get('terrain_notes', '')}"
+            )
+        microzone_section = "## City Microzones\n" + "\n".join(zone_lines)
+
+    tone_block = ""
+    if tone_instruction:
+        tone_block = f"\n## Voice / Tone Instruction\n{tone_instruction}\n"
+
+    parts = [
+        f"You are a hyperlocal weather forecaster writing for {city_name}. {_PROMPT_PERSONA}",
+        tone_block,
+        f"Current UTC time: {now.isoformat()}",
+        "",
+        "## Your Task",
+        f"Generate a comprehensive forecast commentary for {city_name} ({city_slug}). Include:",
+        "",
+        _PROMPT_TASK_CHECKLIST,
+        "",
+        "## Terrain Context",
+        _format_terrain(terrain),
+        "",
+        microzone_section,
+        "",
+        "## Model Disagreement (spread at overlapping timesteps)",
+        _model_disagreement_summary(forecasts),
+        "",
+        "## Data Availability Summary (important)",
+        _data_availability_summary(forecasts),
+        "",
+        "## Horizon-Aware Blend Guidance (explicit model priority rules)",
+        _horizon_blend_summary(forecasts, now),
+        "",
+        "## Latest Model Forecasts",
+        _format_forecasts_by_model(forecasts),
+        "",
+        "## Model Drift (Run-to-Run Changes)",
+        _format_drift(drift_data),
+        "",
+        "## Model Verification Scores (30-day rolling)",
+        _format_verification(verification_scores),
+        "",
+        "## Output Format",
+        "Respond with a JSON object containing these fields:",
+        "{",
+        f'    "city_slug": "{city_slug}",',
+        f'    "city_name": "{city_name}",',
+        _PROMPT_OUTPUT_SCHEMA,
+        "",
+        _PROMPT_GUIDELINES,
+    ]
+    return "\n".join(parts)
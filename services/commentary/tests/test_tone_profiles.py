@@ -37,3 +37,13 @@ def test_get_tone_profile_none_falls_back():
 def test_profiles_have_nonempty_instructions():
     for slug, profile in TONE_PROFILES.items():
         assert len(profile.system_instruction) > 20, f"{slug} instruction too short"
+
+
+def test_profiles_are_read_only():
+    try:
+        TONE_PROFILES["custom"] = TONE_PROFILES["professional"]  # type: ignore[index]
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("TONE_PROFILES should not be mutable")
+    assert "custom" not in TONE_PROFILES
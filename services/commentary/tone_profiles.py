@@ -9,7 +9,9 @@ Closes #59 (tone presets v2 with backend-controlled voice profiles).
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 
 @dataclass(frozen=True)
@@ -19,7 +21,7 @@ class ToneProfile:
     system_instruction: str
 
 
-TONE_PROFILES: dict[str, ToneProfile] = {
+TONE_PROFILES: Mapping[str, ToneProfile] = MappingProxyType({
     "professional": ToneProfile(
         slug="professional",
         label="Professional",
@@ -50,13 +52,12 @@ TONE_PROFILES: dict[str, ToneProfile] = {
             "Never sacrifice data for a joke."
         ),
     ),
-}
+})
 
 DEFAULT_TONE = "professional"
+_DEFAULT_PROFILE = TONE_PROFILES[DEFAULT_TONE]
 
 
 def get_tone_profile(tone_slug: str | None) -> ToneProfile:
     """Return the requested tone profile, falling back to professional."""
-    if tone_slug and tone_slug in TONE_PROFILES:
-        return TONE_PROFILES[tone_slug]
-    return TONE_PROFILES[DEFAULT_TONE]
+    return TONE_PROFILES.get(tone_slug, _DEFAULT_PROFILE)
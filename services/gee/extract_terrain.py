@@ -60,27 +60,13 @@ def extract_terrain_for_city(city_slug: str, city, bq_client: bigquery.Client) -
     slope = ee.Terrain.slope(elevation)
     aspect = ee.Terrain.aspect(elevation)
 
-    # Elevation stats
-    elev_stats = elevation.reduceRegion(
+    # Elevation, slope and aspect stats in a single reduceRegion round trip.
+    # Output keys are prefixed with the band name, e.g. elevation_p50, slope_mean.
+    terrain_stats = elevation.addBands(slope).addBands(aspect).reduceRegion(
         reducer=ee.Reducer.percentile([10, 25, 50, 75, 90])
         .combine(ee.Reducer.minMax(), sharedInputs=True)
-        .combine(ee.Reducer.mean(), sharedInputs=True),
-        geometry=buffer,
-        scale=30,
-        maxPixels=1e7,
-    ).getInfo()
-
-    # Slope stats
-    slope_stats = slope.reduceRegion(
-        reducer=ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True),
-        geometry=buffer,
-        scale=30,
-        maxPixels=1e7,
-    ).getInfo()
-
-    # Aspect stats
-    aspect_stats = aspect.reduceRegion(
-        reducer=ee.Reducer.mean(),
+        .combine(ee.Reducer.mean(), sharedInputs=True)
+        .combine(ee.Reducer.stdDev(), sharedInputs=True),
         geometry=buffer,
         scale=30,
         maxPixels=1e7,
@@ -95,15 +81,15 @@ def extract_terrain_for_city(city_slug: str, city, bq_client: bigquery.Client) -
         maxPixels=1e7,
     ).getInfo()
 
-    # Process land cover percentages
-    land_cover = {}
+    # Process land cover percentages; class names are only resolved for
+    # classes that clear the 1% cut.
     raw_hist = lc_hist.get("landcover", {})
-    total = sum(raw_hist.values()) if raw_hist else 1
-    for code, count in raw_hist.items():
-        name = NLCD_CLASSES.get(str(code), f"Class {code}")
-        pct = round(count / total * 100, 1)
-        if pct >= 1.0:
-            land_cover[name] = pct
+    total = sum(raw_hist.values()) or 1
+    land_cover = {
+        NLCD_CLASSES.get(str(code), f"Class {code}"): pct
+        for code, count in raw_hist.items()
+        if (pct := round(count / total * 100, 1)) >= 1.0
+    }
 
     # Build elevation bands data
     elev_bands_data = {
@@ -111,21 +97,21 @@ def extract_terrain_for_city(city_slug: str, city, bq_client: bigquery.Client) -
             {"elevation_m": b, "elevation_ft": round(b * 3.28084)} for b in city.elev_bands
         ],
         "area_stats": {
-            "min_m": elev_stats.get("elevation_min"),
-            "max_m": elev_stats.get("elevation_max"),
-            "mean_m": elev_stats.get("elevation_mean"),
-            "p10_m": elev_stats.get("elevation_p10"),
-            "p25_m": elev_stats.get("elevation_p25"),
-            "median_m": elev_stats.get("elevation_p50"),
-            "p75_m": elev_stats.get("elevation_p75"),
-            "p90_m": elev_stats.get("elevation_p90"),
+            "min_m": terrain_stats.get("elevation_min"),
+            "max_m": terrain_stats.get("elevation_max"),
+            "mean_m": terrain_stats.get("elevation_mean"),
+            "p10_m": terrain_stats.get("elevation_p10"),
+            "p25_m": terrain_stats.get("elevation_p25"),
+            "median_m": terrain_stats.get("elevation_p50"),
+            "p75_m": terrain_stats.get("elevation_p75"),
+            "p90_m": terrain_stats.get("elevation_p90"),
         },
     }
 
     slope_aspect = {
-        "mean_slope_deg": slope_stats.get("elevation_slope_mean"),
-        "slope_stddev": slope_stats.get("elevation_slope_stdDev"),
-        "mean_aspect_deg": aspect_stats.get("elevation_aspect_mean"),
+        "mean_slope_deg": terrain_stats.get("slope_mean"),
+        "slope_stddev": terrain_stats.get("slope_stdDev"),
+        "mean_aspect_deg": terrain_stats.get("aspect_mean"),
     }
 
     # Write to BigQuery
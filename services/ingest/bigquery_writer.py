@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 import math
+from operator import attrgetter
 import uuid
 
+import numpy as np
 from google.cloud import bigquery
 
 from config import (
@@ -32,23 +37,43 @@ def _get_client() -> bigquery.Client:
     return _client
 
 
+# Column order for forecast_runs rows; values are fetched in one attrgetter call
+# and zipped into the row, then the timestamps are swapped for ISO strings.
+_FORECAST_ROW_FIELDS: tuple[str, ...] = (
+    "city_slug",
+    "model_name",
+    "run_time",
+    "valid_time",
+    "elevation_band",
+    "temperature_2m",
+    "precip_kg_m2",
+    "wind_speed_10m",
+    "wind_dir_10m",
+    "snow_depth",
+    "freezing_level_m",
+    "cape",
+    "relative_humidity",
+)
+_forecast_row_values = attrgetter(*_FORECAST_ROW_FIELDS)
+
+
 def _forecast_point_to_row(point: ForecastPoint) -> dict:
     """Convert a ForecastPoint to a BigQuery row dict."""
-    return {
-        "city_slug": point.city_slug,
-        "model_name": point.model_name,
-        "run_time": point.run_time.isoformat(),
-        "valid_time": point.valid_time.isoformat(),
-        "elevation_band": point.elevation_band,
-        "temperature_2m": point.temperature_2m,
-        "precip_kg_m2": point.precip_kg_m2,
-        "wind_speed_10m": point.wind_speed_10m,
-        "wind_dir_10m": point.wind_dir_10m,
-        "snow_depth": point.snow_depth,
-        "freezing_level_m": point.freezing_level_m,
-        "cape": point.cape,
-        "relative_humidity": point.relative_humidity,
-    }
+    row = dict(zip(_FORECAST_ROW_FIELDS, _forecast_row_values(point)))
+    row["run_time"] = _isoformat(point.run_time)
+    row["valid_time"] = _isoformat(point.valid_time)
+    return row
+
+
+@lru_cache(maxsize=1024)
+def _isoformat(ts: datetime) -> str:
+    """ISO-format a row timestamp.
+
+    An ingest shares one run_time and a few dozen valid_times across every
+    city, elevation band and grid sample, so each distinct value is
+    formatted once instead of once per row.
+    """
+    return ts.isoformat()
 
 
 def _tile_id(lat: float, lon: float) -> str:
@@ -57,33 +82,43 @@ def _tile_id(lat: float, lon: float) -> str:
     return f"tile_{lat_bin}_{lon_bin}"
 
 
-def _uv_from_speed_dir(speed: float | None, direction: float | None) -> tuple[float | None, float | None]:
-    if speed is None or direction is None:
-        return None, None
+def _uv_from_speed_dir(
+    speeds: list[float | None], directions: list[float | None]
+) -> tuple[list[float | None], list[float | None]]:
+    """Convert wind speed/direction columns to U/V columns in one array op (None stays None)."""
+    # np.array maps None to NaN for float dtype, and NaN propagates through the trig
+    speed = np.array(speeds, dtype=np.float64)
+    rad = np.radians(np.array(directions, dtype=np.float64))
     # Inverse of meteorological convention used in ingest (direction wind-from)
     # u = -speed * sin(dir), v = -speed * cos(dir)
-    rad = math.radians(direction)
-    u = -speed * math.sin(rad)
-    v = -speed * math.cos(rad)
-    return round(u, 3), round(v, 3)
+    u = np.round(-speed * np.sin(rad), 3)
+    v = np.round(-speed * np.cos(rad), 3)
+    return (
+        [None if math.isnan(x) else x for x in u.tolist()],
+        [None if math.isnan(x) else x for x in v.tolist()],
+    )
 
 
-def _insert_rows_batched(client: bigquery.Client, table_ref: str, rows: list[dict], batch_size: int = 500) -> int:
+def _insert_rows_batched(client: bigquery.Client, table_ref: str, rows: Iterable[dict], batch_size: int = 500) -> int:
+    """Stream rows in batch_size windows; rows may be a lazy iterable."""
     total_inserted = 0
-    for i in range(0, len(rows), batch_size):
-        batch = rows[i : i + batch_size]
+    start = 0
+    row_iter = iter(rows)
+    while batch := list(islice(row_iter, batch_size)):
+        end = start + len(batch)
         errors = client.insert_rows_json(table_ref, batch)
         if errors:
-            logger.error("BigQuery insert errors for %s (batch %d-%d): %s", table_ref, i, i + len(batch), errors)
+            logger.error("BigQuery insert errors for %s (batch %d-%d): %s", table_ref, start, end, errors)
         else:
             total_inserted += len(batch)
-            logger.info("Inserted %d rows to %s (batch %d-%d)", len(batch), table_ref, i, i + len(batch))
+            logger.info("Inserted %d rows to %s (batch %d-%d)", len(batch), table_ref, start, end)
+        start = end
     return total_inserted
 
 
 async def write_forecast_points(
     points: list[ForecastPoint],
-    cities: dict[str, CityConfig],
+    cities: Mapping[str, CityConfig],
     grid_samples: list[GridSamplePoint] | None = None,
 ) -> int:
     """Stream forecast points to BigQuery and populate gridded indexing tables.
@@ -96,8 +131,8 @@ async def write_forecast_points(
     client = _get_client()
     forecast_table_ref = f"{GCP_PROJECT}.{BQ_DATASET}.{BQ_TABLE}"
 
-    # 1) Write serving table (existing behavior)
-    rows = [_forecast_point_to_row(p) for p in points]
+    # 1) Write serving table (existing behavior); rows are built per batch.
+    rows = (_forecast_point_to_row(p) for p in points)
     total_inserted = _insert_rows_batched(client, forecast_table_ref, rows)
 
     # 2) Build sampled spatial rows from base (non-elevation) points
@@ -112,8 +147,8 @@ async def write_forecast_points(
             tile = _tile_id(gp.lat, gp.lon)
             sampled_rows.append({
                 "model_name": gp.model_name,
-                "run_time": gp.run_time.isoformat(),
-                "valid_time": gp.valid_time.isoformat(),
+                "run_time": _isoformat(gp.run_time),
+                "valid_time": _isoformat(gp.valid_time),
                 "tile_id": tile,
                 "city_slug": gp.aoi_slug,
                 "lat": gp.lat,
@@ -130,14 +165,16 @@ async def write_forecast_points(
     else:
         # Fallback to city-point samples if AOI grid samples are unavailable.
         sampled_points: list[ForecastPoint] = [p for p in points if p.elevation_band is None and p.city_slug in cities]
-        for p in sampled_points:
+        winds_u, winds_v = _uv_from_speed_dir(
+            [p.wind_speed_10m for p in sampled_points], [p.wind_dir_10m for p in sampled_points]
+        )
+        for p, wind_u, wind_v in zip(sampled_points, winds_u, winds_v):
             city = cities[p.city_slug]
             tile = _tile_id(city.lat, city.lon)
-            wind_u, wind_v = _uv_from_speed_dir(p.wind_speed_10m, p.wind_dir_10m)
             sampled_rows.append({
                 "model_name": p.model_name,
-                "run_time": p.run_time.isoformat(),
-                "valid_time": p.valid_time.isoformat(),
+                "run_time": _isoformat(p.run_time),
+                "valid_time": _isoformat(p.valid_time),
                 "tile_id": tile,
                 "city_slug": p.city_slug,
                 "lat": city.lat,
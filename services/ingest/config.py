@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
+
+import orjson
 
 
 @dataclass(frozen=True)
@@ -32,10 +36,35 @@ class AoiConfig:
     polygon: list[tuple[float, float]] = field(default_factory=list)
 
 
-def load_cities() -> dict[str, CityConfig]:
+# Fallbacks used when CITY_AOI_MAP / AOI_CONFIG are unset
+_DEFAULT_CITY_AOI_MAP: dict[str, str] = {
+    "durango": "la-plata-county",
+}
+
+_DEFAULT_AOIS: dict[str, dict] = {
+    "la-plata-county": {
+        "name": "La Plata County, CO",
+        "min_lat": 37.00,
+        "min_lon": -108.35,
+        "max_lat": 37.50,
+        "max_lon": -107.45,
+        "polygon": [
+            {"lat": 37.00, "lon": -108.35},
+            {"lat": 37.00, "lon": -107.45},
+            {"lat": 37.50, "lon": -107.45},
+            {"lat": 37.50, "lon": -108.35},
+        ],
+    }
+}
+
+
+# Config comes from env vars that are fixed for the process lifetime, so each
+# loader parses once and every caller shares the same read-only mapping.
+@cache
+def load_cities() -> Mapping[str, CityConfig]:
     """Load city configs from CITIES_CONFIG env var (JSON)."""
     raw = os.environ.get("CITIES_CONFIG", "{}")
-    data = json.loads(raw)
+    data = orjson.loads(raw)
     cities: dict[str, CityConfig] = {}
     for slug, info in data.items():
         cities[slug] = CityConfig(
@@ -51,38 +80,22 @@ def load_cities() -> dict[str, CityConfig]:
             alert_thresholds=info.get("alert_thresholds", {}),
             branding=info.get("branding", {}),
         )
-    return cities
+    return MappingProxyType(cities)
 
 
-def load_city_aoi_map() -> dict[str, str]:
+@cache
+def load_city_aoi_map() -> Mapping[str, str]:
     """Load city->AOI mapping from CITY_AOI_MAP env var or default Durango mapping."""
-    default_map = {
-        "durango": "la-plata-county",
-    }
-    raw = os.environ.get("CITY_AOI_MAP", json.dumps(default_map))
-    data = json.loads(raw)
-    return {str(k): str(v) for k, v in data.items()}
+    raw = os.environ.get("CITY_AOI_MAP")
+    data = orjson.loads(raw) if raw is not None else _DEFAULT_CITY_AOI_MAP
+    return MappingProxyType({str(k): str(v) for k, v in data.items()})
 
 
-def load_aois() -> dict[str, AoiConfig]:
+@cache
+def load_aois() -> Mapping[str, AoiConfig]:
     """Load AOIs from AOI_CONFIG JSON env var or use a La Plata County default."""
-    default_aois = {
-        "la-plata-county": {
-            "name": "La Plata County, CO",
-            "min_lat": 37.00,
-            "min_lon": -108.35,
-            "max_lat": 37.50,
-            "max_lon": -107.45,
-            "polygon": [
-                {"lat": 37.00, "lon": -108.35},
-                {"lat": 37.00, "lon": -107.45},
-                {"lat": 37.50, "lon": -107.45},
-                {"lat": 37.50, "lon": -108.35},
-            ],
-        }
-    }
-    raw = os.environ.get("AOI_CONFIG", json.dumps(default_aois))
-    data = json.loads(raw)
+    raw = os.environ.get("AOI_CONFIG")
+    data = orjson.loads(raw) if raw is not None else _DEFAULT_AOIS
     aois: dict[str, AoiConfig] = {}
     for slug, info in data.items():
         polygon_raw = info.get("polygon", []) or []
@@ -109,7 +122,14 @@ def load_aois() -> dict[str, AoiConfig]:
             max_lon=float(max_lon),
             polygon=polygon,
         )
-    return aois
+    return MappingProxyType(aois)
+
+
+def reset_config_cache() -> None:
+    """Drop the parsed config so the next load re-reads the env vars (used by tests)."""
+    load_cities.cache_clear()
+    load_city_aoi_map.cache_clear()
+    load_aois.cache_clear()
 
 
 # NOAA GCS bucket paths for each model
@@ -1,24 +1,92 @@
-"""GRIB2 byte-range reader using idx files and xarray."""
+"""GRIB2 byte-range reader using idx files and ecCodes."""
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import math
+import multiprocessing
+import os
 import re
-import traceback
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from typing import Any
 
-import fsspec
+import eccodes
+import httpx
 import numpy as np
-import xarray as xr
 
 from config import AoiConfig, GRIB2_VARIABLES, CityConfig
 
 logger = logging.getLogger(__name__)
 
+_http_client: httpx.AsyncClient | None = None
 
-@dataclass
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        # Pool sized for every forecast hour's idx and span fetches to stay on kept-alive connections
+        _http_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+_decode_pool: ProcessPoolExecutor | None = None
+
+
+def _get_decode_pool() -> ProcessPoolExecutor:
+    global _decode_pool
+    if _decode_pool is None:
+        # Workers come from a forkserver, not a fork of the threaded server process
+        _decode_pool = ProcessPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _decode_pool
+
+
+def start_decode_pool() -> None:
+    """Create the GRIB2 decode worker pool up front (called from the app lifespan)."""
+    _get_decode_pool()
+
+
+def shutdown_decode_pool() -> None:
+    """Stop the decode workers; a later decode starts a fresh pool."""
+    global _decode_pool
+    if _decode_pool is not None:
+        pool, _decode_pool = _decode_pool, None
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _run_in_decode_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """Run func in the decode pool, replacing the pool once if a worker has died.
+
+    A killed worker (e.g. OOM) breaks the whole ProcessPoolExecutor; without a rebuild
+    every later decode on this instance would fail.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_decode_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        global _decode_pool
+        if _decode_pool is pool:
+            logger.warning("Decode worker died; restarting the decode pool")
+            _decode_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(_get_decode_pool(), func, *args)
+
+
+@dataclass(slots=True, frozen=True)
 class ForecastPoint:
     """Extracted forecast data for a single city/time/elevation."""
 
@@ -37,7 +105,7 @@ class ForecastPoint:
     relative_humidity: float | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridSamplePoint:
     """Extracted grid sample point for AOI coverage."""
 
@@ -55,164 +123,353 @@ class GridSamplePoint:
     relative_humidity: float | None
 
 
-def _parse_idx_file(idx_content: str) -> list[dict]:
-    """Parse a GRIB2 .idx index file into byte-range entries.
+# One idx record: NUM:BYTE_OFFSET:d=YYYYMMDDHH:VAR:LEVEL:fcst_info[:...]
+# NUM is not relied on and may be non-integer (NAM emits ids like "8.1").
+_IDX_LINE_RE = re.compile(
+    r"^([^:\n]*):(\d+):([^:\n]*):([^:\n]*):([^:\n]*):([^:\n]*)",
+    re.MULTILINE,
+)
 
-    Each line format: NUM:BYTE_OFFSET:d=YYYYMMDDHH:VAR:LEVEL:fcst_info
-    """
-    entries: list[dict] = []
-    lines = idx_content.strip().split("\n")
 
-    for i, line in enumerate(lines):
-        parts = line.split(":")
-        if len(parts) < 6:
-            continue
+# Canonical var names in .idx files for each GRIB2 shortName
+_IDX_VAR_NAMES: dict[str, tuple[str, ...]] = {
+    "2t": ("TMP",),
+    "10u": ("UGRD",),
+    "10v": ("VGRD",),
+    "tp": ("APCP", "PRATE"),
+    "sde": ("SNOD",),
+    "0deg": ("HGT",),
+    "cape": ("CAPE",),
+    "2r": ("RH",),
+}
 
-        offset = int(parts[1])
-        date_str = parts[2]  # d=YYYYMMDDHH
-        var_name = parts[3]
-        level = parts[4]
-        forecast = parts[5] if len(parts) > 5 else ""
-
-        # Calculate length from next entry's offset
-        end_offset = None
-        if i + 1 < len(lines):
-            next_parts = lines[i + 1].split(":")
-            if len(next_parts) >= 2:
-                end_offset = int(next_parts[1])
-
-        # Some idx variants (observed on NAM) can emit non-integer sequence ids like
-        # "8.1" in the first field. We don't rely on this id downstream, so coerce
-        # safely instead of failing the whole forecast hour.
-        try:
-            entry_index = int(float(parts[0]))
-        except ValueError:
-            entry_index = i + 1
-
-        entries.append({
-            "index": entry_index,
-            "offset": offset,
-            "end_offset": end_offset,
-            "date_str": date_str,
-            "var_name": var_name,
-            "level": level,
-            "forecast": forecast,
-        })
-
-    return entries
-
-
-def _match_idx_entry(entry: dict, var_config: dict) -> bool:
-    """Check if an idx entry matches a desired variable config.
-
-    Level matching must be precise: "2 m above ground" != "2 mb" (millibar).
-    The substring "2 m" would incorrectly match the pressure-level entry "2 mb",
-    resulting in cfgrib receiving a stratospheric GRIB message with wrong structure.
-    """
-    var_name = entry["var_name"]
-    level = entry["level"].strip()
-
-    short_name = var_config["shortName"]
-    type_of_level = var_config.get("typeOfLevel", "")
-    level_str = str(var_config.get("level", ""))
-
-    # Canonical var name in .idx files
-    name_map: dict[str, list[str]] = {
-        "2t": ["TMP"],
-        "10u": ["UGRD"],
-        "10v": ["VGRD"],
-        "tp": ["APCP", "PRATE"],
-        "sde": ["SNOD"],
-        "0deg": ["HGT"],
-        "cape": ["CAPE"],
-        "2r": ["RH"],
-    }
-    expected_names = name_map.get(short_name, [short_name])
-
-    if var_name not in expected_names:
-        return False
 
+def _level_regex(type_of_level: str, level_str: str) -> str | None:
+    """Regex source matching the idx LEVEL field for a variable config; None means no level constraint."""
     # Precise level matching based on typeOfLevel —
     # avoids false matches like "2 m" matching "2 mb" (millibar pressure level)
     if type_of_level == "heightAboveGround" and level_str:
         # Must contain both the numeric height AND "above ground" to exclude mb levels
-        return f"{level_str} m above ground" in level
+        return re.escape(f"{level_str} m above ground")
 
     if type_of_level == "surface":
-        return "surface" in level.lower()
+        return "(?i:surface)"
 
     if type_of_level == "isothermZero":
-        return "0C" in level or "isotherm" in level.lower()
+        return "0C|(?i:isotherm)"
 
     # Fallback: no level constraint
-    return True
+    return None
+
+
+def _compile_idx_pattern(var_config: dict) -> re.Pattern[str]:
+    """Compile a whole-line idx pattern for one variable; group(1) is its byte offset.
+
+    The VAR field must be one of the expected names and the LEVEL field must contain
+    the level match, within the same NUM:OFFSET:DATE:VAR:LEVEL: line layout that
+    _IDX_LINE_RE parses. Level matching must be precise: "2 m above ground" != "2 mb"
+    (millibar), or the decoder would receive a stratospheric message.
+    """
+    short_name = var_config["shortName"]
+    names = "|".join(re.escape(name) for name in _IDX_VAR_NAMES.get(short_name, (short_name,)))
+    level = _level_regex(var_config.get("typeOfLevel", ""), str(var_config.get("level", "")))
+    # The level must occur inside the LEVEL field, i.e. before the next ':' or newline
+    level_field = r"[^:\n]*:" if level is None else rf"(?=[^:\n]*?(?:{level}))[^:\n]*:"
+    return re.compile(rf"^[^:\n]*:(\d+):[^:\n]*:(?:{names}):{level_field}", re.MULTILINE)
+
+
+# One compiled pattern per GRIB2_VARIABLES entry, built once at import
+_VARIABLE_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (var_key, _compile_idx_pattern(var_config)) for var_key, var_config in GRIB2_VARIABLES.items()
+)
 
 
 def _find_byte_ranges(idx_content: str) -> dict[str, tuple[int, int | None]]:
-    """Find byte ranges for desired variables from idx file content."""
-    entries = _parse_idx_file(idx_content)
+    """Find byte ranges for desired variables from idx file content.
+
+    Each variable's compiled pattern searches the raw idx text in C for its first
+    matching line; the message ends at the offset of the next well-formed line.
+    """
     ranges: dict[str, tuple[int, int | None]] = {}
 
-    for var_key, var_config in GRIB2_VARIABLES.items():
-        for entry in entries:
-            if _match_idx_entry(entry, var_config):
-                ranges[var_key] = (entry["offset"], entry["end_offset"])
-                break
+    for var_key, pattern in _VARIABLE_PATTERNS:
+        match = pattern.search(idx_content)
+        if match is None:
+            continue
+        next_line = idx_content.find("\n", match.end())
+        next_entry = None if next_line < 0 else _IDX_LINE_RE.search(idx_content, next_line + 1)
+        ranges[var_key] = (int(match.group(1)), None if next_entry is None else int(next_entry.group(2)))
 
     return ranges
 
 
-def _extract_nearest_value(
-    ds: xr.Dataset, lat: float, lon: float, var_name: str
-) -> float | None:
-    """Extract the nearest grid point value for a lat/lon."""
+# Byte ranges per idx URL (one per model/run/forecast hour). Published idx files
+# never change, so repeat reads of the same hour skip the idx fetch and parse.
+_BYTE_RANGE_CACHE_MAX = 256
+_byte_range_cache: OrderedDict[str, dict[str, tuple[int, int | None]]] = OrderedDict()
+
+
+async def _get_byte_ranges(client: httpx.AsyncClient, idx_url: str) -> dict[str, tuple[int, int | None]]:
+    """Fetch and parse an idx file into variable byte ranges, via a bounded LRU."""
+    cached = _byte_range_cache.get(idx_url)
+    if cached is not None:
+        _byte_range_cache.move_to_end(idx_url)
+        return cached
+
+    resp = await client.get(idx_url)
+    resp.raise_for_status()
+    byte_ranges = _find_byte_ranges(resp.text)
+
+    # Empty results aren't cached so a retry re-reads the idx
+    if byte_ranges:
+        _byte_range_cache[idx_url] = byte_ranges
+        if len(_byte_range_cache) > _BYTE_RANGE_CACHE_MAX:
+            _byte_range_cache.popitem(last=False)
+    return byte_ranges
+
+
+# Ranges separated by at most this many bytes are fetched in one request; the
+# gap bytes are cheaper than an extra round trip to the bucket.
+_RANGE_MERGE_GAP_BYTES = 512 * 1024
+
+
+def _coalesce_byte_ranges(
+    byte_ranges: dict[str, tuple[int, int | None]],
+    max_gap: int = _RANGE_MERGE_GAP_BYTES,
+) -> list[tuple[int, int | None, list[tuple[str, int, int | None]]]]:
+    """Merge per-variable byte ranges into as few HTTP range requests as possible.
+
+    The NOAA buckets are served from S3, which ignores multi-range
+    (multipart/byteranges) requests, so adjacent or nearly adjacent messages are
+    merged into a single span instead. Returns (span_start, span_end, members)
+    where members are the (var_key, start, end) ranges contained in the span and
+    an end of None means "to end of file".
+    """
+    spans: list[tuple[int, int | None, list[tuple[str, int, int | None]]]] = []
+    for var_key, (start, end) in sorted(byte_ranges.items(), key=lambda item: item[1][0]):
+        if spans:
+            span_start, span_end, members = spans[-1]
+            if span_end is None or start - span_end <= max_gap:
+                merged_end = None if span_end is None or end is None else max(span_end, end)
+                members.append((var_key, start, end))
+                spans[-1] = (span_start, merged_end, members)
+                continue
+        spans.append((start, end, [(var_key, start, end)]))
+    return spans
+
+
+async def _fetch_byte_range(
+    client: httpx.AsyncClient, url: str, start: int, end: int | None
+) -> tuple[bytes, int]:
+    """GET one byte range and return (content, absolute offset of content[0])."""
+    range_header = f"bytes={start}-{end - 1}" if end is not None else f"bytes={start}-"
+    resp = await client.get(url, headers={"Range": range_header})
+    resp.raise_for_status()
+    if resp.status_code not in (200, 206):
+        raise ValueError(f"Unexpected HTTP {resp.status_code} for range {range_header} on {url}")
+    # A 200 means the server ignored Range and sent the whole file.
+    return resp.content, 0 if resp.status_code == 200 else start
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class _GridField:
+    """One decoded GRIB2 field: its 2-D (rows, cols) values and the key of its grid.
+
+    Coordinates are not carried along. A projected grid's lat/lon arrays are several
+    times the size of the float32 field and nearest-cell indices depend only on the
+    grid, so they are decoded once per grid by _locate_grid_points instead.
+    """
+
+    values: np.ndarray
+    grid_key: str
+
+
+# Grid types whose points form a lat/lon product, described by 1-D axes
+_REGULAR_GRID_TYPES = frozenset({"regular_ll", "regular_gg"})
+
+
+def _grid_shape(gid: int) -> tuple[int, int]:
+    """(rows, cols) of a message's grid."""
+    if eccodes.codes_get(gid, "gridType") in _REGULAR_GRID_TYPES:
+        return eccodes.codes_get(gid, "Nj"), eccodes.codes_get(gid, "Ni")
+    return eccodes.codes_get(gid, "Ny"), eccodes.codes_get(gid, "Nx")
+
+
+def _decode_grib2(data: bytes) -> _GridField:
+    """Decode one GRIB2 message straight from its bytes with ecCodes.
+
+    Runs in a decode worker process, so only the float32 values (missingValue mapped
+    to NaN) and the grid section's checksum travel back over the pipe.
+    """
+    gid = eccodes.codes_new_from_message(data)
     try:
-        # Handle longitude convention (some GRIB2 use 0-360)
-        lon_360 = lon % 360
+        values = eccodes.codes_get_values(gid)
+        values[values == eccodes.codes_get(gid, "missingValue")] = np.nan
+        return _GridField(
+            values=values.reshape(_grid_shape(gid)).astype(np.float32),
+            grid_key=eccodes.codes_get(gid, "md5GridSection"),
+        )
+    finally:
+        eccodes.codes_release(gid)
 
-        if "latitude" in ds.dims:
-            lat_dim, lon_dim = "latitude", "longitude"
-        elif "lat" in ds.dims:
-            lat_dim, lon_dim = "lat", "lon"
+
+def _locate_grid_points(data: bytes, lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a message's grid coordinates and return (row_idx, col_idx) of each point's nearest cell.
+
+    Runs in a decode worker once per grid. Regular grids are described by 1-D axes from
+    distinctLatitudes/distinctLongitudes; other grids by 2-D per-point coordinates.
+    """
+    gid = eccodes.codes_new_from_message(data)
+    try:
+        if eccodes.codes_get(gid, "gridType") in _REGULAR_GRID_TYPES:
+            grid_lat = eccodes.codes_get_array(gid, "distinctLatitudes")
+            grid_lon = eccodes.codes_get_array(gid, "distinctLongitudes")
         else:
-            # Try coordinate names
-            for coord in ds.coords:
-                if "lat" in coord.lower():
-                    lat_dim = coord
-                elif "lon" in coord.lower():
-                    lon_dim = coord
-
-        # Try both lon conventions
-        for lon_val in [lon, lon_360]:
-            try:
-                point = ds.sel(
-                    {lat_dim: lat, lon_dim: lon_val}, method="nearest"
-                )
-                for v in ds.data_vars:
-                    if var_name.lower() in v.lower() or v.lower() in var_name.lower():
-                        val = float(point[v].values)
-                        if not math.isnan(val):
-                            return val
-                # If exact var name not found, take first data var
-                first_var = list(ds.data_vars)[0]
-                val = float(point[first_var].values)
-                return None if math.isnan(val) else val
-            except (KeyError, ValueError):
-                continue
+            shape = _grid_shape(gid)
+            grid_lat = eccodes.codes_get_array(gid, "latitudes").reshape(shape)
+            grid_lon = eccodes.codes_get_array(gid, "longitudes").reshape(shape)
+    finally:
+        eccodes.codes_release(gid)
+    return _nearest_grid_indices(grid_lat, grid_lon, lats, lons)
+
+
+# Nearest-index lookups keyed by grid section checksum and target points. Every variable
+# of a model run, and every forecast hour after the first, shares the same grid,
+# so the nearest-neighbour search runs once per (grid, point set).
+_GRID_INDEX_CACHE_MAX = 64
+_grid_index_cache: dict[tuple, tuple[np.ndarray, np.ndarray]] = {}
+
+# Curvilinear search only considers grid cells within this many degrees of the
+# query points' bounding box, which keeps the brute-force distance matrix small.
+_CURVILINEAR_SEARCH_MARGIN_DEG = 0.5
+# Upper bound on (grid cells x points) distance elements evaluated at once
+_CURVILINEAR_CHUNK_ELEMS = 4_000_000
+
+
+def _unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Map lat/lon degrees to 3-D unit vectors; nearest by dot product is nearest great-circle."""
+    lat_rad = np.radians(lats)
+    lon_rad = np.radians(lons)
+    cos_lat = np.cos(lat_rad)
+    return np.stack([cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)], axis=-1)
+
+
+def _nearest_curvilinear(
+    grid_lat: np.ndarray, grid_lon: np.ndarray, lats: np.ndarray, lons: np.ndarray
+) -> np.ndarray:
+    """Return the flat index of the nearest cell of a 2-D lat/lon grid for each point."""
+    flat_lat = grid_lat.ravel()
+    flat_lon = _normalize_lon(grid_lon.ravel())
+    target_lons = _normalize_lon(lons)
+
+    # Candidate cells near the points; fall back to the whole grid if none are.
+    margin = _CURVILINEAR_SEARCH_MARGIN_DEG
+    candidates = np.flatnonzero(
+        (flat_lat >= lats.min() - margin)
+        & (flat_lat <= lats.max() + margin)
+        & (flat_lon >= target_lons.min() - margin)
+        & (flat_lon <= target_lons.max() + margin)
+    )
+    if candidates.size == 0:
+        candidates = np.arange(flat_lat.size)
+
+    cell_xyz = _unit_vectors(flat_lat[candidates], flat_lon[candidates])
+    point_xyz = _unit_vectors(lats, target_lons)
+    chunk = max(1, _CURVILINEAR_CHUNK_ELEMS // candidates.size)
+    nearest = np.empty(len(lats), dtype=np.intp)
+    for i in range(0, len(lats), chunk):
+        nearest[i : i + chunk] = np.argmax(cell_xyz @ point_xyz[i : i + chunk].T, axis=0)
+    return candidates[nearest]
+
+
+def _nearest_axis_indices(axis: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Nearest index on a monotonic 1-D coordinate axis (ascending or descending)."""
+    if len(axis) == 1:
+        return np.zeros(len(targets), dtype=np.intp)
+    descending = axis[0] > axis[-1]
+    ascending_axis = axis[::-1] if descending else axis
+    right = np.clip(np.searchsorted(ascending_axis, targets), 1, len(axis) - 1)
+    left = right - 1
+    nearest = np.where(targets - ascending_axis[left] < ascending_axis[right] - targets, left, right)
+    return len(axis) - 1 - nearest if descending else nearest
+
+
+def _nearest_grid_indices(
+    grid_lat: np.ndarray, grid_lon: np.ndarray, lats: np.ndarray, lons: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (row_idx, col_idx) of the nearest grid cell for each point.
+
+    Regular grids search their 1-D lat/lon axes directly; projected grids (HRRR's
+    Lambert conformal) carry 2-D lat/lon coords and are searched by great-circle distance.
+    """
+    if len(lats) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    if grid_lat.ndim == 2:
+        return np.unravel_index(_nearest_curvilinear(grid_lat, grid_lon, lats, lons), grid_lat.shape)
+    # Handle longitude convention (some GRIB2 use 0-360)
+    if float(grid_lon.max()) > 180:
+        lons = lons % 360
+    return _nearest_axis_indices(grid_lat, lats), _nearest_axis_indices(grid_lon, lons)
+
+
+async def _get_grid_indices(
+    data: bytes,
+    grid_key: str,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    query_key: tuple,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Nearest-cell indices of a point set on the grid of `data`, via the grid index cache.
+
+    On a miss the coordinate decode and search run in a decode worker; only the
+    index arrays come back.
+    """
+    cache_key = (grid_key, query_key)
+    cached = _grid_index_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    indices = await _run_in_decode_pool(_locate_grid_points, data, lats, lons)
+    if len(_grid_index_cache) >= _GRID_INDEX_CACHE_MAX:
+        _grid_index_cache.clear()
+    _grid_index_cache[cache_key] = indices
+    return indices
+
+
+def _optional_floats(values: np.ndarray) -> list[float | None]:
+    """Convert a NaN-marked array to the list of float | None that points are built from."""
+    return [None if math.isnan(v) else v for v in values.tolist()]
+
 
-        return None
-    except Exception as e:
-        logger.warning("Failed to extract %s at (%s, %s): %s", var_name, lat, lon, e)
-        return None
+# Significant decimal digits that always round-trip a float32 value
+_FLOAT32_SIG_DIGITS = 9
+
+
+def _optional_float32s(values: np.ndarray) -> list[float | None]:
+    """Like _optional_floats, but each value is rounded to 9 significant digits first.
+
+    Grid sample rows are sent to BigQuery as JSON; widening float32 to a float64 repr
+    pads every value to ~17 digits ("271.2551574707031") for no extra precision. Nine
+    digits always round-trip to the same float32, and rounding is vectorized, so the
+    shorter repr costs little more than a plain tolist().
+    """
+    wide = values.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        decimals = _FLOAT32_SIG_DIGITS - 1 - np.floor(np.log10(np.abs(wide)))
+    # Powers of ten up to 1e22 are exact, so q / scale is the nearest double to the decimal
+    scale = 10.0 ** np.clip(np.nan_to_num(decimals, nan=0.0, posinf=0.0, neginf=0.0), 0, 22)
+    rounded = np.round(wide * scale) / scale
+    return _optional_floats(np.where((decimals >= 0) & (decimals <= 22), rounded, wide))
 
 
-def _compute_wind(u: float | None, v: float | None) -> tuple[float | None, float | None]:
-    """Compute wind speed and direction from U/V components."""
-    if u is None or v is None:
-        return None, None
-    speed = math.sqrt(u**2 + v**2)
-    direction = (270 - math.degrees(math.atan2(v, u))) % 360
-    return round(speed, 2), round(direction, 1)
+def _compute_wind(u: np.ndarray, v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Compute wind speed and direction from U/V component arrays (NaN where either is missing)."""
+    u = u.astype(np.float64, copy=False)
+    v = v.astype(np.float64, copy=False)
+    speed = np.hypot(u, v)
+    direction = (270 - np.degrees(np.arctan2(v, u))) % 360
+    return np.round(speed, 2), np.round(direction, 1)
 
 
 def _normalize_lon(lon: float) -> float:
@@ -220,24 +477,21 @@ def _normalize_lon(lon: float) -> float:
     return ((lon + 180) % 360) - 180
 
 
-def _point_in_polygon(lat: float, lon: float, polygon: list[tuple[float, float]]) -> bool:
-    """Ray-casting point in polygon test for (lat, lon)."""
-    inside = False
-    n = len(polygon)
-    if n < 3:
-        return False
+def _points_in_polygon(lats: np.ndarray, lons: np.ndarray, polygon: Sequence[tuple[float, float]]) -> np.ndarray:
+    """Ray-casting point in polygon test for arrays of (lat, lon); returns a boolean mask.
 
-    j = n - 1
-    for i in range(n):
-        yi, xi = polygon[i]  # lat, lon
-        yj, xj = polygon[j]
-        intersects = ((yi > lat) != (yj > lat)) and (
-            lon < (xj - xi) * (lat - yi) / ((yj - yi) + 1e-12) + xi
-        )
-        if intersects:
-            inside = not inside
-        j = i
-    return inside
+    Every (edge, point) pair is evaluated in one broadcast, so detailed county polygons
+    cost no more interpreter work than a four-corner box.
+    """
+    if len(polygon) < 3:
+        return np.zeros(lats.shape, dtype=bool)
+
+    vertices = np.asarray(polygon, dtype=np.float64)
+    # Edge i runs from vertex i-1 to vertex i (lat, lon)
+    yi, xi = vertices[:, 0, None], vertices[:, 1, None]
+    yj, xj = np.roll(vertices[:, 0], 1)[:, None], np.roll(vertices[:, 1], 1)[:, None]
+    intersects = ((yi > lats) != (yj > lats)) & (lons < (xj - xi) * (lats - yi) / ((yj - yi) + 1e-12) + xi)
+    return np.logical_xor.reduce(intersects, axis=0)
 
 
 def _aoi_target_points(aoi: AoiConfig, resolution_deg: float = 0.25) -> list[tuple[float, float]]:
@@ -246,52 +500,69 @@ def _aoi_target_points(aoi: AoiConfig, resolution_deg: float = 0.25) -> list[tup
     If polygon coordinates are provided, points are clipped to that polygon (scaffolding for
     county/custom AOIs). Otherwise falls back to bbox coverage.
     """
-    lat = aoi.min_lat
-    points: list[tuple[float, float]] = []
-    while lat <= aoi.max_lat + 1e-9:
-        lon = aoi.min_lon
-        while lon <= aoi.max_lon + 1e-9:
-            point = (round(lat, 4), round(lon, 4))
-            if not aoi.polygon or _point_in_polygon(point[0], point[1], aoi.polygon):
-                points.append(point)
-            lon = round(lon + resolution_deg, 4)
-        lat = round(lat + resolution_deg, 4)
-    return points
+    return list(
+        _rasterize_aoi(aoi.min_lat, aoi.min_lon, aoi.max_lat, aoi.max_lon, tuple(aoi.polygon), resolution_deg)
+    )
+
+
+@lru_cache(maxsize=256)
+def _rasterize_aoi(
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float,
+    polygon: tuple[tuple[float, float], ...],
+    resolution_deg: float,
+) -> tuple[tuple[float, float], ...]:
+    """Rasterize an AOI onto a regular lat/lon grid, keeping the cells inside its polygon.
+
+    Cached by geometry, so each distinct AOI pays for the polygon test once per process
+    rather than once per ingest.
+    """
+    n_lat = int(math.floor((max_lat - min_lat + 1e-9) / resolution_deg)) + 1
+    n_lon = int(math.floor((max_lon - min_lon + 1e-9) / resolution_deg)) + 1
+    if n_lat <= 0 or n_lon <= 0:
+        return ()
+
+    lat_axis = np.round(min_lat + np.arange(n_lat) * resolution_deg, 4)
+    lon_axis = np.round(min_lon + np.arange(n_lon) * resolution_deg, 4)
+    lats, lons = (grid.ravel() for grid in np.meshgrid(lat_axis, lon_axis, indexing="ij"))
+    if polygon:
+        mask = _points_in_polygon(lats, lons, polygon)
+        lats, lons = lats[mask], lons[mask]
+    return tuple(zip(lats.tolist(), lons.tolist()))
 
 
 def _extract_aoi_grid_samples(
-    var_data: dict[str, xr.Dataset],
+    columns: dict[str, np.ndarray],
+    target_points: list[tuple[float, float]],
     aoi_slug: str,
     aoi: AoiConfig,
-    model: str,
-    run_time: datetime,
+    model_name: str,
+    run_time_utc: datetime,
     valid_time: datetime,
 ) -> list[GridSamplePoint]:
-    """Extract forecast values for all grid points inside an AOI bounding box.
+    """Build grid samples for all target points inside an AOI.
 
-    Uses pre-generated target points at model resolution and `_extract_nearest_value`
-    for each — same method used for city extraction, fully compatible with cfgrib.
+    `columns` holds each decoded variable's nearest-point values at `target_points`,
+    sliced from the same batched lookup used for city extraction. `model_name` and
+    `run_time_utc` arrive already normalized so every sample shares the same objects.
     """
-    if not var_data:
+    if not columns or not target_points:
         return []
 
-    target_points = _aoi_target_points(aoi)
-    if not target_points:
-        return []
+    none_column: list[float | None] = [None] * len(target_points)
 
-    samples: list[GridSamplePoint] = []
-    for lat, lon in target_points:
-        t = _extract_nearest_value(var_data["temperature_2m"], lat, lon, "t2m") if "temperature_2m" in var_data else None
-        p = _extract_nearest_value(var_data["precip"], lat, lon, "tp") if "precip" in var_data else None
-        u = _extract_nearest_value(var_data["wind_u_10m"], lat, lon, "u10") if "wind_u_10m" in var_data else None
-        v = _extract_nearest_value(var_data["wind_v_10m"], lat, lon, "v10") if "wind_v_10m" in var_data else None
-        s = _extract_nearest_value(var_data["snow_depth"], lat, lon, "sde") if "snow_depth" in var_data else None
-        rh = _extract_nearest_value(var_data["relative_humidity"], lat, lon, "r2") if "relative_humidity" in var_data else None
+    def column(var_key: str) -> list[float | None]:
+        if var_key not in columns:
+            return none_column
+        return _optional_float32s(columns[var_key])
 
-        samples.append(GridSamplePoint(
+    samples = [
+        GridSamplePoint(
             aoi_slug=aoi_slug,
-            model_name=model.upper(),
-            run_time=run_time.replace(tzinfo=timezone.utc),
+            model_name=model_name,
+            run_time=run_time_utc,
             valid_time=valid_time,
             lat=lat,
             lon=lon,
@@ -299,9 +570,19 @@ def _extract_aoi_grid_samples(
             precip_kg_m2=p,
             wind_u_10m=u,
             wind_v_10m=v,
-            snow_depth=s,
+            snow_depth=sd,
             relative_humidity=rh,
-        ))
+        )
+        for (lat, lon), t, p, u, v, sd, rh in zip(
+            target_points,
+            column("temperature_2m"),
+            column("precip"),
+            column("wind_u_10m"),
+            column("wind_v_10m"),
+            column("snow_depth"),
+            column("relative_humidity"),
+        )
+    ]
 
     logger.info(
         "Extracted %d AOI grid samples for %s (%s) at valid_time=%s",
@@ -313,33 +594,34 @@ def _extract_aoi_grid_samples(
     return samples
 
 
-def _build_grib2_url(model: str, run_time: datetime, forecast_hour: int) -> str:
-    """Build public HTTP URL for a GRIB2 file (AWS Open Data buckets)."""
-    date_str = run_time.strftime("%Y%m%d")
-    cycle = f"{run_time.hour:02d}"
-
-    if model == "hrrr":
-        return (
-            f"https://noaa-hrrr-bdp-pds.s3.amazonaws.com/hrrr.{date_str}/conus/"
-            f"hrrr.t{cycle}z.wrfsfcf{forecast_hour:02d}.grib2"
-        )
-    elif model == "gfs":
-        return (
-            f"https://noaa-gfs-bdp-pds.s3.amazonaws.com/gfs.{date_str}/{cycle}/atmos/"
-            f"gfs.t{cycle}z.pgrb2.0p25.f{forecast_hour:03d}"
-        )
-    elif model == "nam":
-        return (
-            f"https://noaa-nam-pds.s3.amazonaws.com/nam.{date_str}/"
-            f"nam.t{cycle}z.awphys{forecast_hour:02d}.tm00.grib2"
-        )
-    elif model == "ecmwf":
-        return (
-            f"https://noaa-ecmwf-pds.s3.amazonaws.com/{date_str}/{cycle}z/"
-            f"0p25/oper/{forecast_hour:03d}.grib2"
-        )
-    else:
-        raise ValueError(f"Unknown model: {model}")
+# Public HTTP URL templates for each model's GRIB2 files (AWS Open Data buckets)
+_GRIB2_URL_TEMPLATES: dict[str, str] = {
+    "hrrr": (
+        "https://noaa-hrrr-bdp-pds.s3.amazonaws.com/hrrr.{date}/conus/"
+        "hrrr.t{cycle:02d}z.wrfsfcf{fhr:02d}.grib2"
+    ),
+    "gfs": (
+        "https://noaa-gfs-bdp-pds.s3.amazonaws.com/gfs.{date}/{cycle:02d}/atmos/"
+        "gfs.t{cycle:02d}z.pgrb2.0p25.f{fhr:03d}"
+    ),
+    "nam": (
+        "https://noaa-nam-pds.s3.amazonaws.com/nam.{date}/"
+        "nam.t{cycle:02d}z.awphys{fhr:02d}.tm00.grib2"
+    ),
+    "ecmwf": (
+        "https://noaa-ecmwf-pds.s3.amazonaws.com/{date}/{cycle:02d}z/"
+        "0p25/oper/{fhr:03d}.grib2"
+    ),
+}
+
+
+def _grib2_url_builder(model: str, run_time: datetime) -> Callable[..., str]:
+    """Bind a model's URL template to one run; call the result with fhr=<forecast hour>."""
+    try:
+        template = _GRIB2_URL_TEMPLATES[model]
+    except KeyError:
+        raise ValueError(f"Unknown model: {model}") from None
+    return partial(template.format, date=run_time.strftime("%Y%m%d"), cycle=run_time.hour)
 
 
 def _build_idx_url(grib2_url: str) -> str:
@@ -347,227 +629,272 @@ def _build_idx_url(grib2_url: str) -> str:
     return grib2_url + ".idx"
 
 
+# Forecast hours processed at once per read_grib2_for_cities call. Each in-flight
+# HRRR hour holds ~90 MB (fetched spans, message slices, decoded fields), so this
+# is bounded by memory: two hours keep a 2-CPU decode pool busy while one fetches.
+_MAX_CONCURRENT_HOURS = 2
+
+# City fields checked (with wind speed) before emitting a point; all missing means skip
+_CITY_NULL_GUARD_VARS = frozenset(
+    {"temperature_2m", "precip", "snow_depth", "relative_humidity", "freezing_level", "cape"}
+)
+
+
 async def read_grib2_for_cities(
     model: str,
     run_time: datetime,
     forecast_hours: list[int],
-    cities: dict[str, CityConfig],
-    aois: dict[str, AoiConfig] | None = None,
-    city_aoi_map: dict[str, str] | None = None,
+    cities: Mapping[str, CityConfig],
+    aois: Mapping[str, AoiConfig] | None = None,
+    city_aoi_map: Mapping[str, str] | None = None,
 ) -> tuple[list[ForecastPoint], list[GridSamplePoint]]:
     """Read GRIB2 data for all cities using byte-range requests.
 
     Returns forecast points and AOI grid samples for BigQuery insertion.
     """
-    results: list[ForecastPoint] = []
-    grid_samples: list[GridSamplePoint] = []
-
-    for fhr in forecast_hours:
-        grib2_url = _build_grib2_url(model, run_time, fhr)
-        idx_url = _build_idx_url(grib2_url)
-
-        valid_time = run_time.replace(tzinfo=timezone.utc)
-        from datetime import timedelta
-        valid_time = valid_time + timedelta(hours=fhr)
-
-        logger.info("Processing %s f%03d: %s", model.upper(), fhr, grib2_url)
-
-        try:
-            # Read idx file to find byte ranges
-            with fsspec.open(idx_url, "r") as f:
-                idx_content = f.read()
-
-            byte_ranges = _find_byte_ranges(idx_content)
-
-            if not byte_ranges:
-                logger.warning("No matching variables found in idx for %s", idx_url)
-                continue
+    model_name = model.upper()
+    run_time_utc = run_time.replace(tzinfo=timezone.utc)
+    build_grib2_url = _grib2_url_builder(model, run_time)
+
+    # Every city's elevation bands flattened once, so lapse-rate adjustment runs as
+    # a single array operation per forecast hour.
+    band_counts = [len(city.elev_bands) for city in cities.values()]
+    band_city_idx = np.repeat(np.arange(len(cities)), band_counts)
+    band_elevs = np.array([band for city in cities.values() for band in city.elev_bands], dtype=np.float64)
+    band_starts = [0, *itertools.accumulate(band_counts)]
+
+    # AOI sample points depend only on the AOI, so they are generated once for all hours.
+    # If city_aoi_map is provided, only sample mapped AOIs (deduped).
+    aoi_targets: list[tuple[str, list[tuple[float, float]]]] = []
+    if aois:
+        selected_aoi_slugs = set(aois.keys())
+        if city_aoi_map:
+            selected_aoi_slugs = {aoi_slug for aoi_slug in city_aoi_map.values() if aoi_slug in aois}
+        aoi_targets = [(aoi_slug, _aoi_target_points(aois[aoi_slug])) for aoi_slug in selected_aoi_slugs]
+
+    # Cities and every sampled AOI's target points share one vectorized nearest-point
+    # lookup per variable; the query arrays are likewise built once.
+    query_lats = [city.lat for city in cities.values()]
+    query_lons = [city.lon for city in cities.values()]
+    for _, target_points in aoi_targets:
+        query_lats.extend(lat for lat, _ in target_points)
+        query_lons.extend(lon for _, lon in target_points)
+    query_lat_array = np.asarray(query_lats, dtype=np.float64)
+    query_lon_array = np.asarray(query_lons, dtype=np.float64)
+    query_key = (tuple(query_lats), tuple(query_lons))
+
+    # One nearest-cell lookup per distinct grid in this read, shared by every variable
+    # and by concurrently running hours, which would otherwise all miss the cache at once.
+    grid_lookups: dict[str, asyncio.Future[tuple[np.ndarray, np.ndarray]]] = {}
+
+    def forget_failed_lookup(grid_key: str, lookup: asyncio.Future) -> None:
+        # A failed lookup is not shared: the next variable or hour on this grid retries it
+        if (lookup.cancelled() or lookup.exception() is not None) and grid_lookups.get(grid_key) is lookup:
+            del grid_lookups[grid_key]
+
+    def grid_indices(grid_key: str, message: bytes) -> asyncio.Future[tuple[np.ndarray, np.ndarray]]:
+        lookup = grid_lookups.get(grid_key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(
+                _get_grid_indices(message, grid_key, query_lat_array, query_lon_array, query_key)
+            )
+            lookup.add_done_callback(partial(forget_failed_lookup, grid_key))
+            grid_lookups[grid_key] = lookup
+        # Shielded so one cancelled hour does not cancel the lookup other hours await
+        return asyncio.shield(lookup)
+
+    # Forecast hours are independent fetch+decode workloads, so they run concurrently
+    # with a bound on how many are held in memory at once.
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_HOURS)
+
+    async def process_hour(fhr: int) -> tuple[list[ForecastPoint], list[GridSamplePoint]]:
+        results: list[ForecastPoint] = []
+        grid_samples: list[GridSamplePoint] = []
+        async with semaphore:
+            grib2_url = build_grib2_url(fhr=fhr)
+            idx_url = _build_idx_url(grib2_url)
+
+            valid_time = run_time_utc + timedelta(hours=fhr)
+
+            logger.info("Processing %s f%03d: %s", model_name, fhr, grib2_url)
+
+            var_data: dict[str, _GridField] = {}
+            messages: dict[str, bytes] = {}
+            try:
+                # Read idx file to find byte ranges over the same pooled client as the GRIB2 spans
+                http = _get_http_client()
+                byte_ranges = await _get_byte_ranges(http, idx_url)
+
+                if not byte_ranges:
+                    logger.warning("No matching variables found in idx for %s", idx_url)
+                    return results, grid_samples
+
+                # Read variable byte ranges, one request per contiguous span
+                # Fetch all spans concurrently; each result is (bytes, base offset) or the error.
+                spans = _coalesce_byte_ranges(byte_ranges)
+                fetched = await asyncio.gather(
+                    *(_fetch_byte_range(http, grib2_url, span_start, span_end) for span_start, span_end, _ in spans),
+                    return_exceptions=True,
+                )
 
-            # Read each variable's byte range
-            var_data: dict[str, xr.Dataset] = {}
-
-            import requests as _requests
-            import tempfile
-            import os
-
-            for var_key, (start, end) in byte_ranges.items():
-                try:
-                    # Use HTTP Range header — fsspec doesn't do real range requests for http://
-                    range_header = f"bytes={start}-{end - 1}" if end is not None else f"bytes={start}-"
-                    resp = _requests.get(
-                        grib2_url,
-                        headers={"Range": range_header},
-                        timeout=60,
-                    )
-                    resp.raise_for_status()
-                    if resp.status_code not in (200, 206):
-                        logger.warning("Unexpected HTTP %s for range %s on %s", resp.status_code, range_header, grib2_url)
+                decode_keys: list[str] = []
+                decode_jobs: list[Coroutine[Any, Any, _GridField]] = []
+                for (span_start, span_end, members), result in zip(spans, fetched):
+                    if isinstance(result, BaseException):
+                        logger.warning(
+                            "Failed to read byte range %s-%s for %s: %s",
+                            span_start,
+                            "" if span_end is None else span_end - 1,
+                            ",".join(var_key for var_key, _, _ in members),
+                            result,
+                        )
                         continue
-                    data = resp.content
-
-                    # Write bytes to temp file and decode with cfgrib
-                    with tempfile.NamedTemporaryFile(suffix=".grib2", delete=False) as tmp:
-                        tmp.write(data)
-                        tmp_path = tmp.name
+                    span_data, base = result
+                    for var_key, start, end in members:
+                        messages[var_key] = span_data[start - base : None if end is None else end - base]
+                        decode_keys.append(var_key)
+                        decode_jobs.append(_run_in_decode_pool(_decode_grib2, messages[var_key]))
+
+                # Decode every variable in parallel across worker processes
+                decoded = await asyncio.gather(*decode_jobs, return_exceptions=True)
+                for var_key, field in zip(decode_keys, decoded):
+                    if isinstance(field, BaseException):
+                        logger.warning(
+                            "Failed to decode %s for %s: %s: %r",
+                            var_key,
+                            grib2_url,
+                            field.__class__.__name__,
+                            field,
+                        )
+                        logger.debug("Decode traceback for %s", var_key, exc_info=field)
+                        continue
+                    var_data[var_key] = field
 
+                # Columns stay float32 (NaN = missing) until points are emitted. A failed
+                # nearest-cell lookup drops only that variable, like a failed decode.
+                query_values: dict[str, np.ndarray] = {}
+                for var_key, field in var_data.items():
                     try:
-                        # Some cfgrib/eccodes combinations can assert on indexpath="".
-                        # Try explicit no-index path first, then fall back to defaults.
-                        try:
-                            ds = xr.open_dataset(
-                                tmp_path,
-                                engine="cfgrib",
-                                backend_kwargs={"indexpath": ""},
-                            )
-                        except AssertionError:
-                            ds = xr.open_dataset(tmp_path, engine="cfgrib")
-
-                        # NOTE: do not force ds.load() here; cfgrib can assert during eager load
-                        # for certain slices. Keep lazy dataset and extract nearest values downstream.
-                        var_data[var_key] = ds
+                        rows, cols = await grid_indices(field.grid_key, messages[var_key])
                     except Exception as e:
                         logger.warning(
-                            "Failed to decode %s for %s: %s: %r\n%s",
-                            var_key,
-                            grib2_url,
-                            e.__class__.__name__,
-                            e,
-                            traceback.format_exc(limit=4),
+                            "Failed to locate points for %s on %s: %s: %r", var_key, grib2_url, e.__class__.__name__, e
                         )
-                    finally:
-                        # Keep temp file for the lifetime of this request because datasets are lazy.
-                        # Cloud Run container FS is ephemeral; cleanup is handled by instance recycle.
-                        pass
-
-                except Exception as e:
-                    logger.warning("Failed to read byte range for %s: %s", var_key, e)
-
-            # Extract AOI-wide grid samples (county/custom coverage).
-            # If city_aoi_map is provided, only sample mapped AOIs (deduped).
-            if aois:
-                selected_aoi_slugs = set(aois.keys())
-                if city_aoi_map:
-                    selected_aoi_slugs = {aoi_slug for aoi_slug in city_aoi_map.values() if aoi_slug in aois}
-
-                for aoi_slug in selected_aoi_slugs:
-                    aoi = aois[aoi_slug]
+                        continue
+                    query_values[var_key] = field.values[rows, cols]
+
+                # Nothing extracted means every city point would be all-null.
+                if not query_values:
+                    logger.warning(
+                        "Skipping all-null city points for %d cities %s f%03d", len(cities), model_name, fhr
+                    )
+                    return results, grid_samples
+
+                # Extract AOI-wide grid samples (county/custom coverage).
+                offset = len(cities)
+                for aoi_slug, target_points in aoi_targets:
+                    next_offset = offset + len(target_points)
                     grid_samples.extend(
                         _extract_aoi_grid_samples(
-                            var_data=var_data,
+                            columns={var_key: values[offset:next_offset] for var_key, values in query_values.items()},
+                            target_points=target_points,
                             aoi_slug=aoi_slug,
-                            aoi=aoi,
-                            model=model,
-                            run_time=run_time,
+                            aoi=aois[aoi_slug],
+                            model_name=model_name,
+                            run_time_utc=run_time_utc,
                             valid_time=valid_time,
                         )
                     )
+                    offset = next_offset
+
+                nan_column = np.full(len(cities), np.nan, dtype=np.float32)
+                city_values = {var_key: values[: len(cities)] for var_key, values in query_values.items()}
+                temps_arr = city_values.get("temperature_2m", nan_column)
+                temps = _optional_floats(temps_arr)
+                speeds_arr, dirs_arr = _compute_wind(
+                    city_values.get("wind_u_10m", nan_column), city_values.get("wind_v_10m", nan_column)
+                )
+                wind_speeds = _optional_floats(speeds_arr)
+                wind_dirs = _optional_floats(dirs_arr)
+                precips = _optional_floats(city_values.get("precip", nan_column))
+                snows = _optional_floats(city_values.get("snow_depth", nan_column))
+                freezings = _optional_floats(city_values.get("freezing_level", nan_column))
+                capes = _optional_floats(city_values.get("cape", nan_column))
+                rhs = _optional_floats(city_values.get("relative_humidity", nan_column))
+
+                band_temps_flat = _lapse_rate_adjust(temps_arr[band_city_idx], band_elevs).tolist()
+
+                # Cities with no value in any guarded field are skipped; decided with one
+                # mask over the available columns instead of per-city None checks.
+                all_null = np.isnan(speeds_arr)
+                for var_key in _CITY_NULL_GUARD_VARS & city_values.keys():
+                    all_null &= np.isnan(city_values[var_key])
+                all_null_rows = all_null.tolist()
+
+                # Build points for each city
+                for i, (city_slug, city) in enumerate(cities.items()):
+                    if all_null_rows[i]:
+                        logger.warning(
+                            "Skipping all-null city point for %s %s f%03d",
+                            city_slug,
+                            model_name,
+                            fhr,
+                        )
+                        continue
 
-            # Extract values for each city
-            for city_slug, city in cities.items():
-                temp_val = None
-                wind_u = None
-                wind_v = None
-                precip_val = None
-                snow_val = None
-                freezing_val = None
-                cape_val = None
-                rh_val = None
-
-                if "temperature_2m" in var_data:
-                    temp_val = _extract_nearest_value(
-                        var_data["temperature_2m"], city.lat, city.lon, "t2m"
-                    )
-                if "wind_u_10m" in var_data:
-                    wind_u = _extract_nearest_value(
-                        var_data["wind_u_10m"], city.lat, city.lon, "u10"
-                    )
-                if "wind_v_10m" in var_data:
-                    wind_v = _extract_nearest_value(
-                        var_data["wind_v_10m"], city.lat, city.lon, "v10"
-                    )
-                if "precip" in var_data:
-                    precip_val = _extract_nearest_value(
-                        var_data["precip"], city.lat, city.lon, "tp"
-                    )
-                if "snow_depth" in var_data:
-                    snow_val = _extract_nearest_value(
-                        var_data["snow_depth"], city.lat, city.lon, "sde"
-                    )
-                if "freezing_level" in var_data:
-                    freezing_val = _extract_nearest_value(
-                        var_data["freezing_level"], city.lat, city.lon, "gh"
-                    )
-                if "cape" in var_data:
-                    cape_val = _extract_nearest_value(
-                        var_data["cape"], city.lat, city.lon, "cape"
-                    )
-                if "relative_humidity" in var_data:
-                    rh_val = _extract_nearest_value(
-                        var_data["relative_humidity"], city.lat, city.lon, "r2"
+                    temp_val = temps[i]
+                    wind_speed = wind_speeds[i]
+                    wind_dir = wind_dirs[i]
+                    precip_val = precips[i]
+                    snow_val = snows[i]
+                    freezing_val = freezings[i]
+                    cape_val = capes[i]
+                    rh_val = rhs[i]
+
+                    # Base-level point (elevation_band=None) plus one point per elevation band,
+                    # emitted as a single batch that shares every field except band/temperature.
+                    band_temps = [temp_val]
+                    if temp_val:
+                        band_temps.extend(band_temps_flat[band_starts[i] : band_starts[i + 1]])
+                    else:
+                        band_temps.extend([None] * len(city.elev_bands))
+                    results.extend(
+                        ForecastPoint(
+                            city_slug=city_slug,
+                            model_name=model_name,
+                            run_time=run_time_utc,
+                            valid_time=valid_time,
+                            elevation_band=band,
+                            temperature_2m=band_temp,
+                            precip_kg_m2=precip_val,
+                            wind_speed_10m=wind_speed,
+                            wind_dir_10m=wind_dir,
+                            snow_depth=snow_val,
+                            freezing_level_m=freezing_val,
+                            cape=cape_val,
+                            relative_humidity=rh_val,
+                        )
+                        for band, band_temp in zip((None, *city.elev_bands), band_temps)
                     )
 
-                wind_speed, wind_dir = _compute_wind(wind_u, wind_v)
-
-                if all(v is None for v in [temp_val, precip_val, wind_speed, snow_val, rh_val, freezing_val, cape_val]):
-                    logger.warning(
-                        "Skipping all-null city point for %s %s f%03d",
-                        city_slug,
-                        model.upper(),
-                        fhr,
-                    )
-                    continue
-
-                # Base-level point (no elevation band)
-                results.append(ForecastPoint(
-                    city_slug=city_slug,
-                    model_name=model.upper(),
-                    run_time=run_time.replace(tzinfo=timezone.utc),
-                    valid_time=valid_time,
-                    elevation_band=None,
-                    temperature_2m=temp_val,
-                    precip_kg_m2=precip_val,
-                    wind_speed_10m=wind_speed,
-                    wind_dir_10m=wind_dir,
-                    snow_depth=snow_val,
-                    freezing_level_m=freezing_val,
-                    cape=cape_val,
-                    relative_humidity=rh_val,
-                ))
-
-                # Generate points for each elevation band
-                for band in city.elev_bands:
-                    results.append(ForecastPoint(
-                        city_slug=city_slug,
-                        model_name=model.upper(),
-                        run_time=run_time.replace(tzinfo=timezone.utc),
-                        valid_time=valid_time,
-                        elevation_band=band,
-                        temperature_2m=_lapse_rate_adjust(temp_val, band) if temp_val else None,
-                        precip_kg_m2=precip_val,
-                        wind_speed_10m=wind_speed,
-                        wind_dir_10m=wind_dir,
-                        snow_depth=snow_val,
-                        freezing_level_m=freezing_val,
-                        cape=cape_val,
-                        relative_humidity=rh_val,
-                    ))
-
-            # Close datasets
-            for ds in var_data.values():
-                ds.close()
-
-        except Exception as e:
-            logger.error("Failed to process %s f%03d: %s", model.upper(), fhr, e)
-            continue
+            except Exception as e:
+                logger.error("Failed to process %s f%03d: %s", model_name, fhr, e)
+        return results, grid_samples
 
+    per_hour = await asyncio.gather(*(process_hour(fhr) for fhr in forecast_hours))
+    results = [point for hour_points, _ in per_hour for point in hour_points]
+    grid_samples = [sample for _, hour_samples in per_hour for sample in hour_samples]
     return results, grid_samples
 
 
-def _lapse_rate_adjust(temp_k: float, elevation_m: int, base_elev: int = 1500) -> float:
-    """Apply standard atmospheric lapse rate (~6.5C/km) for elevation adjustment."""
+def _lapse_rate_adjust(temp_k: np.ndarray, elevation_m: np.ndarray, base_elev: int = 1500) -> np.ndarray:
+    """Apply standard atmospheric lapse rate (~6.5C/km) for elevation adjustment.
+
+    Broadcasts over arrays of temperatures and band elevations.
+    """
     lapse_rate = 0.0065  # K per meter
     delta_elev = elevation_m - base_elev
-    return round(temp_k - (lapse_rate * delta_elev), 2)
+    return np.round(temp_k - (lapse_rate * delta_elev), 2)
 
 
 def get_default_forecast_hours(model: str) -> list[int]:
@@ -597,7 +924,6 @@ def get_latest_run_time(model: str) -> datetime:
         available_hour = now.hour - 4
         cycle = max((c for c in cycles if c <= max(available_hour, 0)), default=18)
         if cycle > available_hour:
-            from datetime import timedelta
             now = now - timedelta(days=1)
         return now.replace(hour=cycle, minute=0, second=0, microsecond=0)
     elif model == "ecmwf":
@@ -605,7 +931,6 @@ def get_latest_run_time(model: str) -> datetime:
         available_hour = now.hour - 6
         cycle = max((c for c in cycles if c <= max(available_hour, 0)), default=12)
         if cycle > available_hour:
-            from datetime import timedelta
             now = now - timedelta(days=1)
         return now.replace(hour=cycle, minute=0, second=0, microsecond=0)
     else:
@@ -10,6 +10,8 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import re
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
@@ -32,6 +34,8 @@ from grib2_reader import (
     get_default_forecast_hours,
     get_latest_run_time,
     read_grib2_for_cities,
+    shutdown_decode_pool,
+    start_decode_pool,
 )
 
 logging.basicConfig(
@@ -40,9 +44,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-CITIES: dict[str, CityConfig] = {}
-AOIS: dict[str, AoiConfig] = {}
-CITY_AOI_MAP: dict[str, str] = {}
+CITIES: Mapping[str, CityConfig] = {}
+AOIS: Mapping[str, AoiConfig] = {}
+CITY_AOI_MAP: Mapping[str, str] = {}
 
 
 @asynccontextmanager
@@ -54,7 +58,11 @@ async def lifespan(app: FastAPI):
     logger.info("Loaded %d cities: %s", len(CITIES), list(CITIES.keys()))
     logger.info("Loaded %d AOIs: %s", len(AOIS), list(AOIS.keys()))
     logger.info("Loaded %d city->AOI mappings: %s", len(CITY_AOI_MAP), CITY_AOI_MAP)
-    yield
+    start_decode_pool()
+    try:
+        yield
+    finally:
+        shutdown_decode_pool()
 
 
 app = FastAPI(
@@ -181,6 +189,9 @@ async def ingest_hrrr(request: Request) -> IngestResponse:
     return await _run_ingestion("hrrr")
 
 
+_HRRR_OBJECT_RE = re.compile(r"hrrr\.(\d{8})/conus/hrrr\.t(\d{2})z")
+
+
 async def _handle_pubsub_hrrr(body: dict) -> IngestResponse:
     """Handle Pub/Sub push notification for HRRR data availability."""
     message = body.get("message", {})
@@ -196,8 +207,7 @@ async def _handle_pubsub_hrrr(body: dict) -> IngestResponse:
             object_name = data.get("name", data.get("objectId", ""))
             if object_name:
                 # Parse run time from filename like hrrr.20240101/conus/hrrr.t00z.wrfsfcf00.grib2
-                import re
-                match = re.search(r"hrrr\.(\d{8})/conus/hrrr\.t(\d{2})z", object_name)
+                match = _HRRR_OBJECT_RE.search(object_name)
                 if match:
                     date_str, hour_str = match.groups()
                     run_time = datetime.strptime(
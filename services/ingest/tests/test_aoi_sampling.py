@@ -0,0 +1,79 @@
+import sys
+import types
+import unittest
+from pathlib import Path
+
+# Stub ecCodes when absent; AOI rasterization is pure NumPy
+try:
+    import eccodes  # noqa: F401
+except ImportError:
+    sys.modules["eccodes"] = types.ModuleType("eccodes")
+
+# Allow importing grib2_reader/config from services/ingest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import _DEFAULT_AOIS, AoiConfig
+from grib2_reader import _aoi_target_points
+
+
+def _default_aoi(slug: str) -> AoiConfig:
+    info = _DEFAULT_AOIS[slug]
+    return AoiConfig(
+        name=info["name"],
+        min_lat=info["min_lat"],
+        min_lon=info["min_lon"],
+        max_lat=info["max_lat"],
+        max_lon=info["max_lon"],
+        polygon=[(p["lat"], p["lon"]) for p in info["polygon"]],
+    )
+
+
+class TestAoiTargetPoints(unittest.TestCase):
+    """Outputs pinned from the original per-point while-loop and ray-casting implementation."""
+
+    def test_default_la_plata_aoi(self):
+        # Ray casting excludes the polygon's top and right edges
+        self.assertEqual(
+            _aoi_target_points(_default_aoi("la-plata-county")),
+            [
+                (37.0, -108.35), (37.0, -108.1), (37.0, -107.85), (37.0, -107.6),
+                (37.25, -108.35), (37.25, -108.1), (37.25, -107.85), (37.25, -107.6),
+            ],
+        )
+
+    def test_concave_polygon_excludes_notch(self):
+        # A "C" open to the east: the notch between lat 37.4 and 37.6 east of -108.6 is outside
+        aoi = AoiConfig(
+            name="C",
+            min_lat=37.0,
+            min_lon=-109.0,
+            max_lat=38.0,
+            max_lon=-108.0,
+            polygon=[
+                (36.9, -109.1), (36.9, -107.9), (37.4, -107.9), (37.4, -108.6),
+                (37.6, -108.6), (37.6, -107.9), (38.1, -107.9), (38.1, -109.1),
+            ],
+        )
+        full_row = [-109.0, -108.75, -108.5, -108.25, -108.0]
+        expected = [(lat, lon) for lat in (37.0, 37.25) for lon in full_row]
+        expected += [(37.5, -109.0), (37.5, -108.75)]
+        expected += [(lat, lon) for lat in (37.75, 38.0) for lon in full_row]
+        self.assertEqual(_aoi_target_points(aoi), expected)
+
+    def test_polygon_with_fewer_than_three_vertices_yields_no_points(self):
+        aoi = AoiConfig(
+            name="segment", min_lat=37.0, min_lon=-109.0, max_lat=37.5, max_lon=-108.5,
+            polygon=[(37.0, -109.0), (37.5, -108.5)],
+        )
+        self.assertEqual(_aoi_target_points(aoi), [])
+
+    def test_no_polygon_covers_bbox(self):
+        aoi = AoiConfig(name="box", min_lat=37.0, min_lon=-108.0, max_lat=37.5, max_lon=-107.5)
+        self.assertEqual(
+            _aoi_target_points(aoi),
+            [(lat, lon) for lat in (37.0, 37.25, 37.5) for lon in (-108.0, -107.75, -107.5)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
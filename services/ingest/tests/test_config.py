@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Allow importing config from services/ingest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import load_aois, load_cities, load_city_aoi_map, reset_config_cache
+
+CITIES_JSON = '{"durango": {"name": "Durango", "lat": 37.27, "lon": -107.88, "elev_bands": [2000, 2500]}}'
+
+
+class TestConfigLoaders(unittest.TestCase):
+    def setUp(self):
+        reset_config_cache()
+        self.addCleanup(reset_config_cache)
+
+    def test_loaders_parse_once_and_share_result(self):
+        with mock.patch.dict(os.environ, {"CITIES_CONFIG": CITIES_JSON}):
+            self.assertIs(load_cities(), load_cities())
+            self.assertEqual(load_cities()["durango"].elev_bands, [2000, 2500])
+
+    def test_cached_results_are_read_only(self):
+        with mock.patch.dict(os.environ, {"CITIES_CONFIG": CITIES_JSON}):
+            for loaded in (load_cities(), load_aois(), load_city_aoi_map()):
+                with self.assertRaises(TypeError):
+                    loaded["extra"] = None
+
+    def test_reset_rereads_environment(self):
+        with mock.patch.dict(os.environ, {"CITIES_CONFIG": CITIES_JSON}):
+            self.assertIn("durango", load_cities())
+        with mock.patch.dict(os.environ, {"CITIES_CONFIG": "{}"}):
+            self.assertIn("durango", load_cities())
+            reset_config_cache()
+            self.assertEqual(dict(load_cities()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import asyncio
+import os
+import signal
+import sys
+import types
+import unittest
+from pathlib import Path
+
+# Stub ecCodes when absent; the pool tests only run stdlib functions in workers
+try:
+    import eccodes  # noqa: F401
+except ImportError:
+    sys.modules["eccodes"] = types.ModuleType("eccodes")
+
+# Allow importing grib2_reader/config from services/ingest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import grib2_reader
+from grib2_reader import _run_in_decode_pool, shutdown_decode_pool, start_decode_pool
+
+
+class TestDecodePool(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(shutdown_decode_pool)
+
+    def test_pool_is_rebuilt_after_a_worker_dies(self):
+        start_decode_pool()
+        first_pool = grib2_reader._decode_pool
+
+        async def run():
+            worker_pid = await _run_in_decode_pool(os.getpid)
+            os.kill(worker_pid, signal.SIGKILL)
+            return worker_pid, await _run_in_decode_pool(os.getpid)
+
+        dead_pid, next_pid = asyncio.run(run())
+        self.assertNotEqual(dead_pid, next_pid)
+        self.assertIsNotNone(grib2_reader._decode_pool)
+        self.assertIsNot(grib2_reader._decode_pool, first_pool)
+
+    def test_shutdown_clears_pool(self):
+        start_decode_pool()
+        shutdown_decode_pool()
+        self.assertIsNone(grib2_reader._decode_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
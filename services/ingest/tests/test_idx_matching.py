@@ -1,39 +1,186 @@
+import asyncio
+import random
 import sys
 import types
 import unittest
 from pathlib import Path
 
-# Stub heavy optional deps so we can import grib2_reader in lightweight test env
-sys.modules.setdefault("numpy", types.ModuleType("numpy"))
-sys.modules.setdefault("xarray", types.ModuleType("xarray"))
-sys.modules.setdefault("fsspec", types.ModuleType("fsspec"))
+# Stub heavy optional deps so we can import grib2_reader in lightweight test env.
+# Installed modules are kept: other test modules import grib2_reader for real numpy work.
+for _name in ("numpy", "eccodes"):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = types.ModuleType(_name)
 
 # Allow importing grib2_reader/config from services/ingest
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from grib2_reader import _match_idx_entry
+import httpx
+
+from config import GRIB2_VARIABLES
+from grib2_reader import (
+    _IDX_VAR_NAMES,
+    _byte_range_cache,
+    _coalesce_byte_ranges,
+    _compile_idx_pattern,
+    _find_byte_ranges,
+    _get_byte_ranges,
+)
+
+
+def _idx_line(var_name: str, level: str, offset: int = 0) -> str:
+    return f"1:{offset}:d=2024010100:{var_name}:{level}:anl:\n"
+
+
+def _reference_byte_ranges(idx_content: str) -> dict[str, tuple[int, int | None]]:
+    """Line-by-line reading of the idx matching rules, to check the compiled patterns against."""
+    entries = []
+    for line in idx_content.splitlines():
+        fields = line.split(":")
+        if len(fields) >= 6 and fields[1].isdigit():
+            entries.append((int(fields[1]), fields[3], fields[4]))
+
+    def level_ok(level: str, var_config: dict) -> bool:
+        type_of_level = var_config.get("typeOfLevel", "")
+        if type_of_level == "heightAboveGround" and var_config.get("level"):
+            return f"{var_config['level']} m above ground" in level
+        if type_of_level == "surface":
+            return "surface" in level.lower()
+        if type_of_level == "isothermZero":
+            return "0C" in level or "isotherm" in level.lower()
+        return True
+
+    ranges = {}
+    for var_key, var_config in GRIB2_VARIABLES.items():
+        names = _IDX_VAR_NAMES.get(var_config["shortName"], (var_config["shortName"],))
+        for i, (offset, var_name, level) in enumerate(entries):
+            if var_name in names and level_ok(level, var_config):
+                ranges[var_key] = (offset, entries[i + 1][0] if i + 1 < len(entries) else None)
+                break
+    return ranges
 
 
 class TestIdxLevelMatching(unittest.TestCase):
     def test_height_above_ground_does_not_match_mb_level(self):
         cfg = {"shortName": "2t", "typeOfLevel": "heightAboveGround", "level": "2"}
-        bad_entry = {"var_name": "TMP", "level": "2 mb"}
-        self.assertFalse(_match_idx_entry(bad_entry, cfg))
+        self.assertIsNone(_compile_idx_pattern(cfg).search(_idx_line("TMP", "2 mb")))
 
     def test_height_above_ground_matches_exact_level(self):
         cfg = {"shortName": "2t", "typeOfLevel": "heightAboveGround", "level": "2"}
-        good_entry = {"var_name": "TMP", "level": "2 m above ground"}
-        self.assertTrue(_match_idx_entry(good_entry, cfg))
+        self.assertIsNotNone(_compile_idx_pattern(cfg).search(_idx_line("TMP", "2 m above ground")))
 
     def test_wind_10m_above_ground_matches(self):
         cfg = {"shortName": "10u", "typeOfLevel": "heightAboveGround", "level": "10"}
-        entry = {"var_name": "UGRD", "level": "10 m above ground"}
-        self.assertTrue(_match_idx_entry(entry, cfg))
+        self.assertIsNotNone(_compile_idx_pattern(cfg).search(_idx_line("UGRD", "10 m above ground")))
 
     def test_surface_field_matches_surface(self):
         cfg = {"shortName": "cape", "typeOfLevel": "surface"}
-        entry = {"var_name": "CAPE", "level": "surface"}
-        self.assertTrue(_match_idx_entry(entry, cfg))
+        self.assertIsNotNone(_compile_idx_pattern(cfg).search(_idx_line("CAPE", "surface")))
+
+    def test_level_must_be_in_level_field(self):
+        cfg = {"shortName": "cape", "typeOfLevel": "surface"}
+        line = "1:0:d=2024010100:CAPE:entire atmosphere:surface:\n"
+        self.assertIsNone(_compile_idx_pattern(cfg).search(line))
+
+    def test_offset_is_first_group(self):
+        cfg = {"shortName": "tp", "typeOfLevel": "surface"}
+        self.assertEqual(_compile_idx_pattern(cfg).search(_idx_line("PRATE", "surface", 1234)).group(1), "1234")
+
+
+class TestFindByteRanges(unittest.TestCase):
+    IDX = (
+        "1:0:d=2024010100:REFC:entire atmosphere:anl:\n"
+        "2:100:d=2024010100:TMP:2 m above ground:anl:\n"
+        "8.1:250:d=2024010100:TMP:2 mb:anl:\n"
+        "4:400:d=2024010100:APCP:surface:0-1 hour acc fcst:\n"
+    )
+
+    def test_end_offset_is_next_entry_offset(self):
+        ranges = _find_byte_ranges(self.IDX)
+        self.assertEqual(ranges["temperature_2m"], (100, 250))
+        self.assertEqual(ranges["precip"], (400, None))
+
+    def test_malformed_lines_are_skipped_without_breaking_offsets(self):
+        idx = (
+            "1:0:d=2024010100:TMP:2 m above ground:anl:\n\ngarbage line\n"
+            "2:100:d=2024010100:REFC:entire atmosphere:anl:\n"
+        )
+        self.assertEqual(_find_byte_ranges(idx)["temperature_2m"], (0, 100))
+
+    def test_byte_ranges_keep_first_match_per_variable(self):
+        idx = self.IDX + "5:900:d=2024010100:TMP:2 m above ground:anl:\n"
+        ranges = _find_byte_ranges(idx)
+        self.assertEqual(ranges["temperature_2m"], (100, 250))
+        self.assertEqual(ranges["precip"], (400, 900))
+        self.assertNotIn("snow_depth", ranges)
+
+    def test_matches_line_by_line_reference_on_random_idx_files(self):
+        rng = random.Random(20240101)
+        var_names = ["TMP", "UGRD", "VGRD", "APCP", "PRATE", "SNOD", "HGT", "CAPE", "RH", "REFC", "DPT"]
+        levels = [
+            "2 m above ground", "10 m above ground", "80 m above ground", "2 mb", "1000 mb", "surface",
+            "Surface", "0C isotherm", "highest tropospheric freezing level", "entire atmosphere",
+        ]
+        for _ in range(3000):
+            lines, offset = [], 0
+            for n in range(rng.randint(0, 40)):
+                roll = rng.random()
+                if roll < 0.03:
+                    lines.append("")
+                elif roll < 0.06:
+                    lines.append("garbage line")
+                else:
+                    num = f"{n + 1}.1" if roll < 0.1 else str(n + 1)
+                    var_name, level = rng.choice(var_names), rng.choice(levels)
+                    lines.append(f"{num}:{offset}:d=2024010100:{var_name}:{level}:{rng.choice(['anl', 'surface'])}:")
+                    offset += rng.randint(1, 10_000)
+            idx = "\n".join(lines) + "\n"
+            self.assertEqual(_find_byte_ranges(idx), _reference_byte_ranges(idx), idx)
+
+
+class TestByteRangeCoalescing(unittest.TestCase):
+    def test_adjacent_ranges_share_one_span(self):
+        spans = _coalesce_byte_ranges({"wind_v_10m": (600, 800), "wind_u_10m": (400, 600)})
+        self.assertEqual(spans, [(400, 800, [("wind_u_10m", 400, 600), ("wind_v_10m", 600, 800)])])
+
+    def test_distant_ranges_stay_separate(self):
+        spans = _coalesce_byte_ranges({"a": (0, 100), "b": (10_000_000, None)}, max_gap=1024)
+        self.assertEqual(spans, [(0, 100, [("a", 0, 100)]), (10_000_000, None, [("b", 10_000_000, None)])])
+
+    def test_open_ended_range_extends_span_to_eof(self):
+        spans = _coalesce_byte_ranges({"a": (0, 100), "b": (100, None)})
+        self.assertEqual(spans, [(0, None, [("a", 0, 100), ("b", 100, None)])])
+
+
+class TestByteRangeCache(unittest.TestCase):
+    IDX = "1:0:d=2024010100:TMP:2 m above ground:anl:\n2:100:d=2024010100:APCP:surface:0-1 hour acc fcst:\n"
+
+    def setUp(self):
+        _byte_range_cache.clear()
+
+    def _fetch_twice(self, idx_text: str) -> tuple[list, int]:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, text=idx_text)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return [await _get_byte_ranges(client, "https://bucket/f001.idx") for _ in range(2)]
+
+        return asyncio.run(run()), len(calls)
+
+    def test_repeat_reads_hit_cache(self):
+        results, n_calls = self._fetch_twice(self.IDX)
+        self.assertEqual(n_calls, 1)
+        self.assertEqual(results[0], {"temperature_2m": (0, 100), "precip": (100, None)})
+        self.assertIs(results[0], results[1])
+
+    def test_empty_results_are_not_cached(self):
+        _, n_calls = self._fetch_twice("1:0:d=2024010100:REFC:entire atmosphere:anl:\n")
+        self.assertEqual(n_calls, 2)
 
 
 if __name__ == "__main__":
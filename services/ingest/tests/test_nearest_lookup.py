@@ -0,0 +1,115 @@
+import sys
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Stub ecCodes when absent; these tests only exercise the pure-NumPy nearest search
+try:
+    import eccodes  # noqa: F401
+except ImportError:
+    sys.modules["eccodes"] = types.ModuleType("eccodes")
+
+# Allow importing grib2_reader/config from services/ingest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import grib2_reader
+from grib2_reader import _nearest_axis_indices, _nearest_curvilinear, _nearest_grid_indices
+
+
+def _haversine_nearest(grid_lat: np.ndarray, grid_lon: np.ndarray, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Flat index of the nearest cell for each point by brute-force haversine distance."""
+    cell_lat = np.radians(grid_lat.ravel())[:, None]
+    cell_lon = np.radians(grid_lon.ravel())[:, None]
+    lat = np.radians(lats)[None, :]
+    lon = np.radians(lons)[None, :]
+    a = np.sin((lat - cell_lat) / 2) ** 2 + np.cos(cell_lat) * np.cos(lat) * np.sin((lon - cell_lon) / 2) ** 2
+    return np.argmin(2 * np.arcsin(np.sqrt(a)), axis=0)
+
+
+class TestNearestAxisIndices(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+
+    def _brute_force(self, axis: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        return np.argmin(np.abs(axis[:, None] - targets[None, :]), axis=0)
+
+    def test_ascending_axis(self):
+        axis = np.arange(-110.0, -100.0, 0.25)
+        targets = self.rng.uniform(-110, -100.25, 500)
+        np.testing.assert_array_equal(_nearest_axis_indices(axis, targets), self._brute_force(axis, targets))
+
+    def test_descending_axis(self):
+        axis = np.arange(45.0, 30.0, -0.25)
+        targets = self.rng.uniform(30.25, 45, 500)
+        np.testing.assert_array_equal(_nearest_axis_indices(axis, targets), self._brute_force(axis, targets))
+
+    def test_targets_outside_axis_clamp_to_ends(self):
+        ascending = np.array([0.0, 1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(_nearest_axis_indices(ascending, np.array([-5.0, 9.0])), [0, 3])
+        descending = ascending[::-1]
+        np.testing.assert_array_equal(_nearest_axis_indices(descending, np.array([-5.0, 9.0])), [3, 0])
+
+    def test_single_point_axis(self):
+        np.testing.assert_array_equal(_nearest_axis_indices(np.array([5.0]), np.array([1.0, 9.0])), [0, 0])
+
+
+class TestNearestGridIndices(unittest.TestCase):
+    def test_regular_grid_with_0_360_longitudes(self):
+        grid_lat = np.arange(50.0, 20.0, -0.25)
+        grid_lon = np.arange(0.0, 360.0, 0.25)
+        rows, cols = _nearest_grid_indices(grid_lat, grid_lon, np.array([37.27, 37.35]), np.array([-107.88, -108.58]))
+        np.testing.assert_array_equal(grid_lat[rows], [37.25, 37.25])
+        np.testing.assert_array_equal(grid_lon[cols], [252.0, 251.5])
+
+    def test_regular_grid_with_signed_longitudes(self):
+        grid_lat = np.arange(30.0, 45.0, 0.5)
+        grid_lon = np.arange(-115.0, -100.0, 0.5)
+        rows, cols = _nearest_grid_indices(grid_lat, grid_lon, np.array([37.27]), np.array([-107.88]))
+        self.assertEqual((grid_lat[rows[0]], grid_lon[cols[0]]), (37.5, -108.0))
+
+    def test_empty_targets(self):
+        rows, cols = _nearest_grid_indices(np.arange(3.0), np.arange(3.0), np.array([]), np.array([]))
+        self.assertEqual((rows.size, cols.size), (0, 0))
+
+
+class TestNearestCurvilinear(unittest.TestCase):
+    """A skewed 2-D lat/lon grid in 0-360 longitudes, as ecCodes returns for HRRR's Lambert grid."""
+
+    def setUp(self):
+        i, j = np.mgrid[0:60, 0:80]
+        self.grid_lat = 30.0 + 0.1 * i + 0.02 * j
+        self.grid_lon = 250.0 + 0.1 * j - 0.03 * i
+        rng = np.random.default_rng(11)
+        self.lats = rng.uniform(31.0, 35.5, 400)
+        self.lons = rng.uniform(-109.0, -103.0, 400)
+
+    def _expected(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        return _haversine_nearest(self.grid_lat, self.grid_lon, lats, lons)
+
+    def test_matches_brute_force_haversine(self):
+        nearest = _nearest_curvilinear(self.grid_lat, self.grid_lon, self.lats, self.lons)
+        np.testing.assert_array_equal(nearest, self._expected(self.lats, self.lons))
+
+    def test_chunked_search_matches(self):
+        with mock.patch.object(grib2_reader, "_CURVILINEAR_CHUNK_ELEMS", 1000):
+            nearest = _nearest_curvilinear(self.grid_lat, self.grid_lon, self.lats, self.lons)
+        np.testing.assert_array_equal(nearest, self._expected(self.lats, self.lons))
+
+    def test_points_off_the_grid_snap_to_nearest_edge_cell(self):
+        lats = np.array([29.5, 25.0, 40.0])
+        lons = np.array([-108.0, -140.0, -90.0])
+        nearest = _nearest_curvilinear(self.grid_lat, self.grid_lon, lats, lons)
+        np.testing.assert_array_equal(nearest, self._expected(lats, lons))
+
+    def test_grid_indices_unravel_to_rows_and_cols(self):
+        rows, cols = _nearest_grid_indices(self.grid_lat, self.grid_lon, self.lats, self.lons)
+        np.testing.assert_array_equal(
+            np.ravel_multi_index((rows, cols), self.grid_lat.shape), self._expected(self.lats, self.lons)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import types
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import numpy as np
+
+# Stub ecCodes when absent; decoding is faked below
+try:
+    import eccodes  # noqa: F401
+except ImportError:
+    sys.modules["eccodes"] = types.ModuleType("eccodes")
+
+# Allow importing grib2_reader/config from services/ingest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import grib2_reader
+from config import CityConfig
+
+IDX = "1:0:d=2024010100:TMP:2 m above ground:anl:\n2:100:d=2024010100:RH:2 m above ground:anl:\n"
+
+
+class TestReadGrib2ForCities(unittest.TestCase):
+    def setUp(self):
+        grib2_reader._byte_range_cache.clear()
+        grib2_reader._grid_index_cache.clear()
+        self.locate_calls = 0
+
+    async def _fake_pool(self, func, *args):
+        if func is grib2_reader._decode_grib2:
+            value = 280.0 if args[0].startswith(b"T") else 50.0
+            return grib2_reader._GridField(values=np.full((2, 2), value, dtype=np.float32), grid_key="grid")
+        self.locate_calls += 1
+        if self.locate_calls == 1:
+            raise RuntimeError("transient lookup failure")
+        return np.array([0]), np.array([0])
+
+    def _read(self, forecast_hours):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith(".idx"):
+                return httpx.Response(200, text=IDX)
+            start, end = (int(part) if part else None for part in request.headers["range"][6:].split("-"))
+            body = b"T" * 100 + b"R" * 100
+            return httpx.Response(206, content=body[start : None if end is None else end + 1])
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                with (
+                    mock.patch.object(grib2_reader, "_http_client", client),
+                    mock.patch.object(grib2_reader, "_run_in_decode_pool", self._fake_pool),
+                    mock.patch.object(grib2_reader, "_MAX_CONCURRENT_HOURS", 1),
+                ):
+                    return await grib2_reader.read_grib2_for_cities(
+                        "gfs",
+                        datetime(2024, 1, 1),
+                        forecast_hours,
+                        {"durango": CityConfig(name="Durango", lat=37.27, lon=-107.88)},
+                    )
+
+        return asyncio.run(run())
+
+    def test_failed_grid_lookup_drops_one_variable_and_is_retried(self):
+        points, _ = self._read([0, 1])
+        by_hour = {p.valid_time.hour: p for p in points}
+        # Hour 0: the temperature lookup failed, humidity retried the lookup and succeeded
+        self.assertIsNone(by_hour[0].temperature_2m)
+        self.assertEqual(by_hour[0].relative_humidity, 50.0)
+        # Hour 1 reuses the successful lookup
+        self.assertEqual((by_hour[1].temperature_2m, by_hour[1].relative_humidity), (280.0, 50.0))
+        self.assertEqual(self.locate_calls, 2)
+
+
+class TestOptionalFloat32s(unittest.TestCase):
+    def test_values_round_trip_to_the_same_float32(self):
+        rng = np.random.default_rng(3)
+        values = (10.0 ** rng.uniform(-12, 9, 20_000) * rng.choice([-1, 1], 20_000)).astype(np.float32)
+        values[:3] = [0.0, 271.2551574707031, 4.175000190734863]
+        encoded = grib2_reader._optional_float32s(values)
+        np.testing.assert_array_equal(np.array(encoded, dtype=np.float32), values)
+        self.assertEqual(encoded[1:3], [271.255157, 4.17500019])
+        significant = (repr(abs(v)).split("e")[0].replace(".", "").strip("0") for v in encoded)
+        self.assertLessEqual(max(len(digits) for digits in significant), 9)
+
+    def test_nan_becomes_none(self):
+        self.assertEqual(grib2_reader._optional_float32s(np.array([np.nan, 1.5], dtype=np.float32)), [None, 1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()